@@ -1,16 +1,12 @@
 import math
-import cmath
 from mpmath import mp, pi
+import lz_store
 
 mp.dps = 50
 phi = (1 + mp.sqrt(5)) / 2
 
 # Original levels (truncated for brevity)
-lz_levels = {
-    'LZ0': 0.8934691018292812244027,
-    'LZ1': 0.77925056166461613546,
-    # Add remaining original levels here...
-}
+lz_levels = lz_store.lz_levels(2, dps=50, recursion='sine')
 
 # Transformations dictionary
 transformations = {
@@ -26,11 +22,11 @@ transformations = {
 }
 
 # Calculate imaginary levels
-def calculate_imaginary_levels(lz0, levels_count=14):
+def calculate_imaginary_levels(levels_count=14):
     imaginary_levels = {}
-    current = math.asin(lz0)
+    upward = lz_store.upward_levels(levels_count, dps=50)
     for i in range(1, levels_count + 1):
-        current = cmath.asin(current)
+        current = upward[f'LZ-{i}']
         real_part = abs(current.real)
         imag_part = abs(current.imag)
 
@@ -46,7 +42,7 @@ def calculate_imaginary_levels(lz0, levels_count=14):
     return imaginary_levels
 
 # Generate a combined dictionary of all levels
-imaginary_levels = calculate_imaginary_levels(lz_levels['LZ0'])
+imaginary_levels = calculate_imaginary_levels()
 all_levels = {**lz_levels, **imaginary_levels}
 
 # Function to compute transformations and output results as a list of dicts
@@ -1,6 +1,6 @@
-import math
-import cmath
 from mpmath import mp, sin, asin, pi, sqrt
+import lz_store
+import lz_zoo
 
 mp.dps = 50
 
@@ -126,51 +126,14 @@ atomic_energies = {
 
 
 # LOGOS original LZ levels
-lz_levels = {
-    'LZ0': 0.8934691018292812244027,
-    'LZ1': 0.77925056166461613546,     
-    'LZ2': 0.70274643589057133551,      
-    'LZ3': 0.646315844994190005925,    
-    'LZ4': 0.602249409166941011016,     
-    'LZ5': 0.566497560827266638609, 
-    'LZ6': 0.536680037956250069056,  
-    'LZ7': 0.511285603178539657953,      
-    'LZ8': 0.48929884626327098115,      
-    'LZ9': 0.470007121557258645354,   
-    'LZ10': 0.452892634722198191231,
-    # ... include all LOGOS LZ levels up to LZ45
-}
-
-# Calculate upward complex levels
-lz0 = lz_levels['LZ0']
-a0 = math.asin(lz0)
+lz_levels = lz_store.lz_levels(11, dps=50, recursion='sine')
 
-complex_levels = {}
-current = a0
-for i in range(1, 20):  # Extended to LZ-19 for more coverage
-    current = cmath.asin(current)
-    complex_levels[f'LZ-{i}'] = current
+# Calculate upward complex levels (shared asin engine, LZ-1 .. LZ-19)
+complex_levels = lz_store.upward_levels(19, dps=50)
 
-# Create quantum levels with positive imaginary signs
-quantum_levels = {}
-for name, complex_val in complex_levels.items():
-    real_part = abs(float(complex_val.real))
-    imag_part = abs(float(complex_val.imag))
-    
-    quantum_levels[f'{name}_real'] = real_part
-    quantum_levels[f'{name}_imag'] = imag_part
-    quantum_levels[f'{name}_sum'] = real_part + imag_part
-    quantum_levels[f'{name}_mag'] = math.sqrt(real_part**2 + imag_part**2)
-    quantum_levels[f'{name}_prod'] = real_part * imag_part if imag_part > 0 else real_part
-    
-    if imag_part > 0:
-        quantum_levels[f'{name}_inv_imag'] = 1.0 / imag_part
-        for power in [2, 3, 4]:
-            quantum_levels[f'{name}_imag_p{power}'] = imag_part ** power
-            quantum_levels[f'{name}_real_p{power}'] = real_part ** power
-
-# Add original levels
-quantum_levels.update(lz_levels)
+# Create quantum levels with positive imaginary signs (original levels as kind '')
+zoo = lz_zoo.build_zoo(real=lz_levels.values(), upward=complex_levels.values(), kinds=(
+    '', '_real', '_imag', '_sum', '_mag', '_prod', '_inv_imag') + lz_zoo.powers(('imag', 'real'), (2, 3, 4)))
 
 
 phi = (1 + mp.sqrt(5)) / 2
@@ -199,25 +162,12 @@ print("CALCULATING LZ RELATIONS FOR ALL ELEMENTS:")
 print(f"{'Element':<4} {'Energy (eV)':<12} {'Best LZ Formula':<35} {'Derived':<12} {'Error':<10} {'Status':<12}")
 print("-" * 90)
 
+# Compiled transformations over every distinct level, constants hoisted
+candidates = lz_zoo.CandidateTable(zoo, transformations)
+
 for element, energy in atomic_energies.items():
-    best_error = float('inf')
-    best_formula = ""
-    best_value = 0
-    
-    for lz_name, lz_val in quantum_levels.items():
-        lz_val_float = float(lz_val)
-        
-        for trans_name, trans_func in transformations.items():
-            try:
-                derived = float(trans_func(lz_val_float))
-                error = abs(derived - energy)
-                
-                if error < best_error:
-                    best_error = error
-                    best_formula = f"{trans_name.replace('LZ', lz_name)}"
-                    best_value = derived
-            except:
-                continue
+    cls, best_value, best_error = candidates.best(energy)
+    best_formula = lz_zoo.formula(*candidates.members(cls)[0]) if cls != lz_zoo.NO_MATCH else ""
     
     status = "EXCELLENT" if best_error < 0.1 else "VERY GOOD" if best_error < 0.5 else "GOOD" if best_error < 1.0 else "CLOSE"
     print(f"{element:<4} {energy:<12.3f} {best_formula:<35} {best_value:<12.3f} {best_error:<10.3f} {status:<12}")
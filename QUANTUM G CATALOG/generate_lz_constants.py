@@ -1,5 +1,9 @@
+import os
 import matplotlib.pyplot as plt
-from mpmath import mp, sin, exp, mpf, plot
+from mpmath import mp, plot
+from lz_maps import KAPPA_SEED
+from lz_sequence import lz_hqs_table
+from lz_render import render_sequence
 """
 LOGOS THEORY
 Author: Martin Doina 
@@ -12,25 +16,28 @@ mp.dps = 100
 # Define the number of iterations
 num_iterations = 20
 
-# Initialize with the EXACT high-precision initial value
-psi_values = [mpf('0.8934691018292812244027')]
-
-# Compute the evolution with high precision
-for i in range(1, num_iterations):
-    psi_values.append(sin(psi_values[i-1]) + exp(-psi_values[i-1]))
-
-# Convert to float for plotting (loses precision but needed for matplotlib)
-psi_values_float = [float(val) for val in psi_values]
-
-# Plot
-plt.figure(figsize=(8, 4))
-plt.plot(range(num_iterations), psi_values_float, marker="o", linestyle="-", color="blue", label="Ψ(n) Evolution")
-plt.xlabel("Recursion Level (n)")
-plt.ylabel("Wave Function Ψ(n)")
-plt.title("LOGOS Recursive Wave Function Evolution")
-plt.legend()
-plt.grid(True)
-plt.show()
+# Compute the evolution with high precision from the EXACT initial value.
+# LZ and HQS come out of one pass sharing each exp(-ψ) evaluation.
+table = lz_hqs_table(num_iterations, KAPPA_SEED, dps=mp.dps, recursion='logos')
+psi_values = table['lz']
+
+# Headless runs: LOGOS_PLOT=<file> writes the plot instead of opening a window
+plot_file = os.environ.get('LOGOS_PLOT')
+if plot_file:
+    render_sequence(plot_file, psi_values)
+else:
+    # Convert to float for plotting (loses precision but needed for matplotlib)
+    psi_values_float = [float(val) for val in psi_values]
+
+    # Plot
+    plt.figure(figsize=(8, 4))
+    plt.plot(range(num_iterations), psi_values_float, marker="o", linestyle="-", color="blue", label="Ψ(n) Evolution")
+    plt.xlabel("Recursion Level (n)")
+    plt.ylabel("Wave Function Ψ(n)")
+    plt.title("LOGOS Recursive Wave Function Evolution")
+    plt.legend()
+    plt.grid(True)
+    plt.show()
 
 # Display the computed values WITH FULL PRECISION
 print("LOGOS EXACT LZ & HQS VALUES (100 decimals):")
@@ -40,6 +47,5 @@ for i, val in enumerate(psi_values):
 
 print(f"\nHQS VALUES for each LZ:")
 print("=" * 85)
-for i, val in enumerate(psi_values):
-    hqs = exp(-val) / val
+for i, hqs in enumerate(table['hqs']):
     print(f"HQS_{i} = {hqs}")
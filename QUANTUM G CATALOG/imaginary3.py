@@ -1,58 +1,11 @@
-import math
-import cmath
 from mpmath import mp, sin, asin, pi, sqrt
+import lz_store
+import lz_zoo
 
 mp.dps = 50
 
 # LOGOS original LZ levels
-lz_levels = {
-    'LZ0': 0.8934691018292812244027,
-    'LZ1': 0.77925056166461613546,     
-    'LZ2': 0.70274643589057133551,      
-    'LZ3': 0.646315844994190005925,    
-    'LZ4': 0.602249409166941011016,     
-    'LZ5': 0.566497560827266638609, 
-    'LZ6': 0.536680037956250069056,  
-    'LZ7': 0.511285603178539657953,      
-    'LZ8': 0.48929884626327098115,      
-    'LZ9': 0.470007121557258645354,   
-    'LZ10': 0.452892634722198191231,
-    'LZ11': 0.437568375282611265813,
-    'LZ12': 0.423738191480105923173,
-    'LZ13': 0.411170897372839147563,
-    'LZ14': 0.399682908854264909393, 
-    'LZ15': 0.38912626245028160807,
-    'LZ16': 0.379380142329113925443,
-    'LZ17': 0.370344758293618177551,
-    'LZ18': 0.361936838052865187321,
-    'LZ19': 0.354086251973120615728,
-    'LZ20': 0.346733447618190129634,
-    'LZ21': 0.339827473319247090606,
-    'LZ22': 0.333324436845215765359,
-    'LZ23': 0.32718628998495953142,
-    'LZ24': 0.321379860372918368459,
-    'LZ25': 0.315876073068827859531,
-    'LZ26': 0.310649319329871311505,
-    'LZ27': 0.3056769406866667788,
-    'LZ28': 0.300938804166517768292,
-    'LZ29': 0.296416950177173712814,
-    'LZ30': 0.292095298768961361413,
-    'LZ31': 0.287959403143925088878,
-    'LZ32': 0.283996241664756972798,
-    'LZ33': 0.280194041436796408411,
-    'LZ34': 0.276542127938351935615,
-    'LZ35': 0.273030796262904206157,
-    'LZ36': 0.269651200387920475574,
-    'LZ37': 0.266395257555432414033,
-    'LZ38': 0.263255565381111088366,
-    'LZ39': 0.260225329732728870093,
-    'LZ40': 0.25729830175935910849,
-    'LZ41': 0.254468722727492864449,
-    'LZ42': 0.251731275543292632323,
-    'LZ43': 0.24908104202213930352,
-    'LZ44': 0.246513465115757403688,
-    'LZ45': 0.244024267318637789654,
-}
+lz_levels = lz_store.lz_levels(46, dps=50, recursion='sine')
 
 phi = (1 + mp.sqrt(5)) / 2
 
@@ -60,44 +13,17 @@ print("REFINED QUANTUM PARTICLE MASS DERIVATION")
 print("=" * 70)
 
 # Calculate more upward complex levels for better coverage
-lz0 = lz_levels['LZ0']
-a0 = math.asin(lz0)
-
-complex_levels = {}
-current = a0
-for i in range(1, 8):  # Go up to LZ-7
-    current = cmath.asin(current)
-    complex_levels[f'LZ-{i}'] = current
-
-# Create enhanced quantum levels with more combinations
-quantum_levels = {}
-
-for name, complex_val in complex_levels.items():
-    real_part = abs(float(complex_val.real))
-    imag_part = abs(float(complex_val.imag))
-    
-    # Basic components
-    quantum_levels[f'{name}_real'] = real_part
-    quantum_levels[f'{name}_imag'] = imag_part
-    
-    # Combinations
-    quantum_levels[f'{name}_sum'] = real_part + imag_part
-    quantum_levels[f'{name}_mag'] = math.sqrt(real_part**2 + imag_part**2)
-    quantum_levels[f'{name}_prod'] = real_part * imag_part if imag_part > 0 else real_part
-    
-    # Powers and inverses
-    if imag_part > 0:
-        quantum_levels[f'{name}_inv_imag'] = 1.0 / imag_part
-        for power in [2, 3, 4]:
-            quantum_levels[f'{name}_imag_p{power}'] = imag_part ** power
-            quantum_levels[f'{name}_real_p{power}'] = real_part ** power
-    
-    # Mixed operations
-    quantum_levels[f'{name}_real_phi'] = real_part * float(phi)
-    quantum_levels[f'{name}_imag_phi'] = imag_part * float(phi) if imag_part > 0 else real_part
-
-# Add all to main levels
-lz_levels.update(quantum_levels)
+complex_levels = lz_store.upward_levels(7, dps=50)
+
+# Create enhanced quantum levels with more combinations: basic components,
+# combinations, powers and inverses (only for a nonzero imaginary part),
+# mixed operations
+zoo = lz_zoo.build_zoo(real=lz_levels.values(), upward=complex_levels.values(), kinds=(
+    '', '_real', '_imag', '_sum', '_mag', '_prod', '_inv_imag')
+    + tuple(kind for power in (2, 3, 4) for kind in (
+        f'_imag_p{power}', lz_zoo.FeatureKind(f'_real_p{power}', f're**{power}', where='im != 0')))
+    + (lz_zoo.FeatureKind('_real_phi', f're * {float(phi)!r}'),
+       lz_zoo.FeatureKind('_imag_phi', f'where(im > 0, im * {float(phi)!r}, re)')))
 
 # Enhanced transformations for fine-tuning
 transformations = {
@@ -130,24 +56,20 @@ problem_particles = {
 print("IMPROVING PROBLEMATIC PARTICLE MATCHES")
 print("=" * 70)
 
+# Every (level, transformation) value once; equal candidates share a class
+candidates = lz_zoo.CandidateTable(zoo, transformations)
+
 for particle, mass in problem_particles.items():
     print(f"\n{particle}: {mass} GeV")
     print("Close matches:")
     
     close_matches = []
-    for lz_name, lz_val in lz_levels.items():
-        lz_val_float = float(lz_val)
-        
-        for trans_name, trans_func in transformations.items():
-            try:
-                derived = float(trans_func(lz_val_float))
-                error = abs(derived - mass)
-                percent_error = (error / mass) * 100
-                
-                if percent_error < 50:  # Show reasonably close matches
-                    close_matches.append((error, f"{trans_name.replace('LZ', lz_name)} = {derived:.6f}"))
-            except:
-                continue
+    for cls, derived, error in candidates.nearest(mass):
+        percent_error = (error / mass) * 100
+        if percent_error >= 50 or len(close_matches) >= 5:
+            break
+        for lz_name, trans_name in candidates.members(cls):
+            close_matches.append((error, f"{lz_zoo.formula(lz_name, trans_name)} = {derived:.6f}"))
     
     # Show top 5 closest matches
     close_matches.sort()
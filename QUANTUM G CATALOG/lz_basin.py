@@ -0,0 +1,125 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+"""
+LOGOS THEORY - COMPLEX-PLANE BASIN MAP OF THE UPWARD asin MAP
+Author: Martin Doina
+
+proof_atomic_imaginary.py classifies the levels of one seed as REAL- or
+IMAGINARY-dominant. This maps a whole region of the plane instead: every
+pixel z0 is iterated under z ← asin(z) (cmath branch convention) and
+records
+
+  iterations   steps until z enters an attracting petal of the parabolic
+               point 0 (max_iter if never)
+  behaviour    UNCAPTURED, UPPER / LOWER (which petal captured it),
+               NONFINITE
+  real_levels  how many levels along the way were REAL-dominant
+
+The chain only creeps into 0 like sqrt(3/k), so the step size says
+nothing about convergence there. Capture uses the Fatou coordinate of
+lz_jump instead: near 0, w = -3/z² advances by ~1 per step, and the
+petals are Re w > 3/radius², i.e. the disks z² ∈ D(-radius²/2, radius²/2)
+around the upper and lower imaginary axis. For radius <= 0.5 a point
+that gets inside stays there and goes to 0.
+
+The plane is cut into tiles that a process pool fills independently;
+inside a tile all pixels advance together in NumPy and finished pixels
+drop out. Results go straight into a .npy memmap, so a 16k × 16k map
+needs only a tile's worth of RAM per worker.
+"""
+
+DEFAULT_TILE = 512
+
+UNCAPTURED, UPPER, LOWER, NONFINITE = 0, 1, 2, 3
+BEHAVIOURS = ('UNCAPTURED', 'UPPER', 'LOWER', 'NONFINITE')
+
+BASIN_DTYPE = np.dtype([('iterations', '<u2'), ('behaviour', 'u1'), ('real_levels', '<u2')])
+
+
+def _pixel_grid(region, shape, rows, cols):
+    """Pixel centres of rows × cols as complex128 (row 0 is the top edge)"""
+    re_min, re_max, im_min, im_max = region
+    height, width = shape
+    re = re_min + (np.arange(*cols) + 0.5) * (re_max - re_min) / width
+    im = im_max - (np.arange(*rows) + 0.5) * (im_max - im_min) / height
+    return re[None, :] + 1j * im[:, None]
+
+
+def basin_tile(z, max_iter=200, radius=0.5):
+    """Classify an array of starting points -> structured BASIN_DTYPE array"""
+    z = np.asarray(z, dtype=np.complex128)
+    result = np.zeros(z.shape, dtype=BASIN_DTYPE)
+    flat = result.reshape(-1)
+    current = z.ravel().copy()
+    active = np.arange(current.size)
+    with np.errstate(invalid='ignore', over='ignore'):
+        for k in range(1, max_iter + 1):
+            if active.size == 0:
+                break
+            # -0.0 + 0.0 = +0.0: real points take the upper side of the cut
+            current.imag += 0.0
+            nxt = np.arcsin(current)
+            flat['real_levels'][active] += np.abs(nxt.real) > np.abs(nxt.imag)
+
+            bad = ~np.isfinite(nxt)
+            # Re(-1/z²) > 1/radius², without dividing by z²
+            u = nxt * nxt
+            captured = -u.real * radius * radius > np.abs(u) ** 2
+            done = captured | bad
+            if done.any():
+                idx = active[done]
+                flat['iterations'][idx] = k
+                flat['behaviour'][idx] = np.where(bad[done], NONFINITE,
+                                                  np.where(nxt.imag[done] < 0, LOWER, UPPER))
+                keep = ~done
+                active, current = active[keep], nxt[keep]
+            else:
+                current = nxt
+    flat['iterations'][active] = max_iter
+    flat['behaviour'][active] = UNCAPTURED
+    return result
+
+
+def _fill_tile(job):
+    """Worker: compute one tile and write it into the shared memmap"""
+    path, region, shape, rows, cols, max_iter, radius = job
+    tile = basin_tile(_pixel_grid(region, shape, rows, cols), max_iter, radius)
+    out = np.load(path, mmap_mode='r+')
+    out[rows[0]:rows[1], cols[0]:cols[1]] = tile
+    out.flush()
+    del out
+    return rows, cols, np.bincount(tile['behaviour'].ravel(), minlength=len(BEHAVIOURS))
+
+
+def basin_map(path, region=(-2.0, 2.0, -2.0, 2.0), shape=(1024, 1024), max_iter=200,
+              radius=0.5, tile=DEFAULT_TILE, workers=None):
+    """Fill a (height, width) BASIN_DTYPE .npy memmap at `path` for region
+
+    region = (re_min, re_max, im_min, im_max). Returns the memmap and the
+    pixel count per behaviour.
+    """
+    height, width = shape
+    out = np.lib.format.open_memmap(path, mode='w+', dtype=BASIN_DTYPE, shape=shape)
+    del out
+    jobs = [(path, region, shape, (r, min(r + tile, height)), (c, min(c + tile, width)), max_iter, radius)
+            for r in range(0, height, tile) for c in range(0, width, tile)]
+
+    counts = np.zeros(len(BEHAVIOURS), dtype=np.int64)
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        for _, _, tile_counts in pool.map(_fill_tile, jobs):
+            counts += tile_counts
+    return np.load(path, mmap_mode='r'), dict(zip(BEHAVIOURS, counts.tolist()))
+
+
+if __name__ == "__main__":
+    import sys
+    from lz_render import render_basin
+
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1024
+    basin, counts = basin_map('asin_basin.npy', shape=(size, size))
+    print(f"asin basin map {size}×{size}: {counts}")
+    print(f"Mean iterations: {basin['iterations'].mean():.1f}")
+    render_basin('asin_basin.png', basin, (-2.0, 2.0, -2.0, 2.0))
@@ -0,0 +1,106 @@
+import os
+import json
+import hashlib
+import tempfile
+from mpmath import mp, mpf
+
+from lz_maps import KAPPA_SEED, get_recursion
+
+"""
+LOGOS THEORY - CHECKPOINTED LZ RUNS
+Author: Martin Doina
+
+Long LZ recursions (10^7+ steps at 200+ digits) periodically save
+(step, state, precision, seed hash) so a crash only costs the work since
+the last checkpoint. The state is stored as its exact binary mantissa and
+exponent, so a resumed run continues bit for bit.
+"""
+
+CHECKPOINT_VERSION = 1
+
+
+def seed_hash(seed, recursion):
+    """Identifies the (seed, recursion) a checkpoint belongs to"""
+    return hashlib.sha256(f"{recursion}|{seed}".encode('utf-8')).hexdigest()
+
+
+def save_checkpoint(path, step, state, prec, seed, recursion):
+    """Atomically write a checkpoint file"""
+    # mpf.man_exp drops the sign, so read the raw (sign, man, exp, bc) tuple
+    sign, man, exp, _ = state._mpf_
+    if sign:
+        man = -man
+    data = {
+        'version': CHECKPOINT_VERSION,
+        'recursion': recursion,
+        'seed': seed,
+        'seed_hash': seed_hash(seed, recursion),
+        'step': step,
+        'prec': prec,
+        # Hex keeps 200+ digit mantissas compact in the JSON
+        'man': format(man, 'x'),
+        'exp': exp,
+    }
+    # A private temp file per writer (as in lz_store), synced before the
+    # rename so a crash leaves either the old or the new checkpoint
+    directory = os.path.dirname(os.path.abspath(path))
+    with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=directory,
+                                     suffix='.tmp', delete=False) as f:
+        tmp = f.name
+        try:
+            json.dump(data, f)
+            f.flush()
+            os.fsync(f.fileno())
+        except BaseException:
+            f.close()
+            os.unlink(tmp)
+            raise
+    os.chmod(tmp, 0o644)
+    os.replace(tmp, path)
+
+
+def load_checkpoint(path):
+    """Read a checkpoint back as a dict with an exact mpf 'state'"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if data.get('version') != CHECKPOINT_VERSION:
+        raise ValueError(f"{path}: unsupported checkpoint version {data.get('version')}")
+    if data['seed_hash'] != seed_hash(data['seed'], data['recursion']):
+        raise ValueError(f"{path}: seed hash does not match the stored seed")
+    with mp.workprec(data['prec']):
+        data['state'] = mpf((int(data['man'], 16), data['exp']))
+    return data
+
+
+def _run(path, step, state, prec, seed, recursion, steps, every, sink):
+    advance = get_recursion(recursion)
+    with mp.workprec(prec):
+        while step < steps:
+            state = advance(state)
+            step += 1
+            if sink is not None:
+                sink(step, state)
+            if step % every == 0 or step == steps:
+                save_checkpoint(path, step, state, prec, seed, recursion)
+    return step, state
+
+
+def run_lz(path, steps, seed=KAPPA_SEED, dps=200, recursion='logos', every=10000, sink=None):
+    """Iterate LZ_0 -> LZ_steps, checkpointing to `path` every `every` steps
+
+    `sink(n, LZ_n)` is called for each new level instead of keeping a list.
+    Returns (step, state).
+    """
+    seed = str(seed)
+    with mp.workdps(dps):
+        prec = mp.prec
+        state = mpf(seed)
+    save_checkpoint(path, 0, state, prec, seed, recursion)
+    return _run(path, 0, state, prec, seed, recursion, steps, every, sink)
+
+
+def resume_lz(path, steps, every=10000, sink=None):
+    """Continue a checkpointed run up to `steps` at its original precision"""
+    data = load_checkpoint(path)
+    return _run(path, data['step'], data['state'], data['prec'], data['seed'],
+                data['recursion'], steps, every, sink)
@@ -0,0 +1,188 @@
+from mpmath import mp, mpf, iv, diff, factorial, asin, sqrt, log
+
+from lz_maps import KAPPA_SEED, get_recursion, get_derivative, iv_workdps, asin_step
+from lz_sequence import take_lz
+
+"""
+LOGOS THEORY - LZ ATTRACTOR SOLVER
+Author: Martin Doina
+
+Finds the limit of an LZ recursion without iterating the ladder to death:
+a few cheap iterates are Aitken-accelerated into a starting guess, Newton
+with precision doubling takes it to the requested dps, and an interval
+sign-change bracket certifies how many digits are correct.
+"""
+
+GUARD_DPS = 10
+WARMUP_DPS = 30
+# Precision doubling reaches any target in ~log2(dps / WARMUP_DPS) steps;
+# a run this long is not converging
+MAX_NEWTON_STEPS = 100
+
+
+def _aitken(xs):
+    """Aitken Δ² extrapolation of the last three terms"""
+    x0, x1, x2 = xs[-3:]
+    denom = x2 - 2 * x1 + x0
+    return x2 if denom == 0 else x2 - (x2 - x1) ** 2 / denom
+
+
+def _multiplicity(g, dg, guess, max_steps=400):
+    """Low-precision Newton run; the step ratio reveals the root multiplicity"""
+    x, prev_step, ratio = guess, None, mpf(0)
+    noise = mpf(10) ** (-WARMUP_DPS + 5)
+    for _ in range(max_steps):
+        gx = g(x)
+        # Stop before g drowns in cancellation noise near the root
+        if abs(gx) <= noise * max(abs(x), 1):
+            break
+        step = gx / dg(x)
+        x -= step
+        if prev_step:
+            ratio = abs(step / prev_step)
+        prev_step = step
+    # Newton on a root of multiplicity m contracts by (m - 1) / m
+    if ratio < mpf('0.25') or ratio >= 1:
+        return x, 1
+    return x, int(mp.nint(1 / (1 - ratio)))
+
+
+def _certified_digits(g, root, dps):
+    """Largest k such that g changes sign across root ± 10^-k (interval-checked)
+
+    Digits are relative to max(|root|, 1), i.e. absolute for roots near zero.
+    """
+    scale = max(abs(root), mpf(1)) if root != 0 else mpf(1)
+
+    def brackets(k):
+        r = scale * mpf(10) ** (-k)
+        with iv_workdps(dps):
+            lo = g(iv.mpf(root - r), iv)
+            hi = g(iv.mpf(root + r), iv)
+            return (lo.b < 0 < hi.a) or (hi.b < 0 < lo.a)
+
+    good, bad = 0, dps + GUARD_DPS
+    while bad - good > 1:
+        k = (good + bad) // 2
+        if brackets(k):
+            good = k
+        else:
+            bad = k
+    # Bracket radius 10^-k pins the root to k digits, less one for rounding
+    return max(good - 1, 0)
+
+
+def _newton(g, dg, x, m, target, max_steps=MAX_NEWTON_STEPS):
+    """Newton (modified by the multiplicity) with precision doubling to `target` dps"""
+    work = WARMUP_DPS
+    for steps in range(1, max_steps + 1):
+        work = min(2 * work, target)
+        with mp.workdps(work):
+            x = +x
+            gx = g(x)
+            step = 0 if gx == 0 else m * gx / dg(x)
+            x -= step
+            if work == target and abs(step) <= max(abs(x), 1) * mpf(10) ** (-target + 2):
+                return x, steps
+    raise ValueError(f"Newton did not reach {target} dps in {max_steps} steps "
+                     f"(last step {mp.nstr(step, 3)} at x = {mp.nstr(x, 10)})")
+
+
+def solve_attractor(recursion='logos', dps=1000, seed=KAPPA_SEED, warmup=6):
+    """Limit of the LZ recursion at `dps` digits, with certified digit count"""
+    f = get_recursion(recursion)
+    df = get_derivative(recursion)
+
+    def g(x, ctx=mp):
+        return f(x, ctx) - x
+
+    def dg(x, ctx=mp):
+        return df(x, ctx) - 1
+
+    with mp.workdps(WARMUP_DPS):
+        xs = take_lz(warmup, seed, WARMUP_DPS, recursion)
+        guess = _aitken(xs)
+        x, m = _multiplicity(g, dg, guess)
+
+    target = dps + GUARD_DPS
+    x, newton_steps = _newton(g, dg, x, m, target)
+
+    with mp.workdps(target):
+        slope = df(x)
+        digits = min(_certified_digits(g, x, target), dps)
+        result = {
+            'recursion': recursion,
+            'attractor': +x,
+            'multiplicity': m,
+            'slope': slope,
+            'kind': 'attracting' if m == 1 and abs(slope) < 1 else 'parabolic' if m > 1 else 'repelling',
+            'certified_digits': digits,
+            'iterations': warmup + newton_steps,
+        }
+        result.update(_tail_constants(f, df, x, m, slope, xs))
+    return result
+
+
+def _tail_constants(f, df, fixed, m, slope, xs):
+    """Leading-order tail LZ_n - LZ_∞ fitted to the last warm-up iterate"""
+    n = len(xs) - 1
+    with mp.workdps(WARMUP_DPS):
+        fixed = mpf(fixed)
+        offset = xs[-1] - fixed
+        if m == 1:
+            # Geometric tail: LZ_n ≈ LZ_∞ + K·λ^n
+            return {'tail_constant': offset / mpf(slope) ** n if slope != 0 else mpf(0)}
+        # Parabolic tail: f(x) ≈ x - a·(x - x*)^m  ⇒  (x - x*)^(1-m) ≈ (m-1)·a·(n + n0)
+        a = -diff(f, fixed, m) / factorial(m)
+        n0 = offset ** (1 - m) / ((m - 1) * a) - n
+        return {'tail_constant': a, 'tail_offset': n0}
+
+
+def tail_level(result, n):
+    """Leading-order asymptotic estimate of LZ_n from a solve_attractor result"""
+    fixed = result['attractor']
+    if result['multiplicity'] == 1:
+        return fixed + result['tail_constant'] * result['slope'] ** n
+    m = result['multiplicity']
+    a = result['tail_constant']
+    return fixed + ((m - 1) * a * (n + result['tail_offset'])) ** (mpf(-1) / (m - 1))
+
+
+def solve_upward(seed=KAPPA_SEED, dps=50, warmup=30):
+    """Fixed point of the complex upward chain z ← asin(z) and its approach
+
+    The last of `warmup` levels seeds the multiplicity probe and Newton;
+    'rate' is the observed step ratio |Δ_k / Δ_(k-1)| (→ 1 for a
+    parabolic point) and 'decay' the power p in |LZ-k| ~ k^-p. At a
+    multiple root only about dps / multiplicity digits are resolvable.
+    """
+    def g(z):
+        return asin(z) - z
+
+    def dg(z):
+        return 1 / sqrt(1 - z * z) - 1
+
+    with mp.workdps(WARMUP_DPS):
+        chain = [asin_step(mpf(seed))]
+        for _ in range(warmup):
+            chain.append(asin_step(chain[-1]))
+        steps = [abs(b - a) for a, b in zip(chain, chain[1:])]
+        rate = steps[-1] / steps[-2]
+        # |z_k| ~ k^-p measured between levels k/2 and k
+        half = warmup // 2
+        decay = log(abs(chain[half]) / abs(chain[-1])) / log(mpf(warmup) / half)
+        x, m = _multiplicity(g, dg, chain[-1])
+
+    target = dps + GUARD_DPS
+    x, newton_steps = _newton(g, dg, x, m, target)
+    with mp.workdps(target):
+        slope = 1 / sqrt(1 - x * x)
+        return {
+            'fixed_point': +x,
+            'multiplicity': m,
+            'slope': slope,
+            'kind': 'attracting' if m == 1 and abs(slope) < 1 else 'parabolic' if m > 1 else 'repelling',
+            'rate': rate,
+            'decay': decay,
+            'iterations': warmup + newton_steps,
+        }
@@ -0,0 +1,85 @@
+from mpmath import mp, mpf, iv, log10, floor
+
+from lz_maps import KAPPA_SEED, get_recursion, iv_workdps
+
+"""
+LOGOS THEORY - CERTIFIED LZ / HQS TABLES
+Author: Martin Doina
+
+Runs the LZ recursion in interval arithmetic (mpmath.iv) so every level
+comes with a rigorous enclosure, and picks the smallest working precision
+that still delivers a requested number of correct digits.
+"""
+
+
+def enclose_levels(depth, seed=KAPPA_SEED, dps=50, recursion='logos', with_hqs=False):
+    """Interval enclosures of LZ_0 .. LZ_{depth-1} (and HQS_n) at working dps"""
+    step = get_recursion(recursion)
+    levels, hqs = [], []
+    with iv_workdps(dps):
+        # The decimal seed string itself is enclosed, not a rounded float
+        value = iv.mpf(str(seed))
+        for n in range(depth):
+            levels.append(value)
+            if with_hqs:
+                hqs.append(iv.exp(-value) / value)
+            if n + 1 < depth:
+                value = step(value, iv)
+    return (levels, hqs) if with_hqs else levels
+
+
+def midpoint(interval):
+    """Midpoint at the current mp precision (ivmpf.mid uses the iv precision)"""
+    return (mpf(interval.a) + mpf(interval.b)) / 2
+
+
+def correct_digits(interval):
+    """Number of significant decimal digits the enclosure pins down"""
+    lo, hi = mpf(interval.a), mpf(interval.b)
+    if lo <= 0 <= hi:
+        return 0
+    width = hi - lo
+    if width == 0:
+        return mp.inf
+    return max(int(floor(-log10(width / min(abs(lo), abs(hi))))), 0)
+
+
+def _worst_digits(depth, seed, dps, recursion, with_hqs):
+    result = enclose_levels(depth, seed, dps, recursion, with_hqs)
+    enclosures = result[0] + result[1] if with_hqs else result
+    return min(correct_digits(x) for x in enclosures), result
+
+
+def certified_levels(depth, digits, seed=KAPPA_SEED, recursion='logos', with_hqs=False):
+    """Smallest working dps whose enclosures all carry `digits` correct digits"""
+    with mp.workdps(digits + 10):
+        # Digits lost along the ladder are roughly independent of dps, so
+        # each shortfall is added back before bisecting down to the minimum
+        failing, dps = digits - 1, digits + 2
+        while True:
+            worst, result = _worst_digits(depth, seed, dps, recursion, with_hqs)
+            if worst >= digits:
+                break
+            failing, dps = dps, dps + (digits - worst) + 1
+        while dps - failing > 1:
+            mid = (dps + failing) // 2
+            worst, trial = _worst_digits(depth, seed, mid, recursion, with_hqs)
+            if worst >= digits:
+                dps, result = mid, trial
+            else:
+                failing = mid
+
+    enclosures, hqs = result if with_hqs else (result, [])
+    with mp.workdps(dps):
+        table = {
+            'dps': dps,
+            'digits': digits,
+            'levels': [midpoint(x) for x in enclosures],
+            'enclosures': enclosures,
+            'level_digits': [correct_digits(x) for x in enclosures],
+        }
+        if with_hqs:
+            table['hqs'] = [midpoint(x) for x in hqs]
+            table['hqs_enclosures'] = hqs
+            table['hqs_digits'] = [correct_digits(x) for x in hqs]
+    return table
@@ -0,0 +1,196 @@
+import warnings
+
+import numpy as np
+from mpmath import mp, mpf, findroot
+
+from lz_maps import get_recursion, get_float_recursion, get_float_derivative
+from lz_fixed_point import solve_attractor
+
+"""
+LOGOS THEORY - INVERSE LZ (PREDECESSOR) SOLVER
+Author: Martin Doina
+
+Walks the LZ ladder backwards: given ψ_n, find every ψ_{n-1} in a search
+window with f(ψ_{n-1}) = ψ_n. The window is split at the critical points
+of f into monotone branches; on each branch the root is unique and is
+found by bracketed Newton, vectorized over thousands of targets at once.
+More than one branch hit means the predecessor is ambiguous.
+"""
+
+DEFAULT_WINDOW = (-np.pi / 2, np.pi)
+GRID = 4096
+NEWTON_STEPS = 60
+
+
+def _float_map(recursion):
+    step = get_float_recursion(recursion)
+
+    def f(x):
+        x = np.asarray(x, dtype=np.float64)
+        return step(x, np.empty_like(x))
+    return f
+
+
+def monotone_branches(recursion='logos', window=DEFAULT_WINDOW):
+    """Split the window at the critical points of f -> (S, 2) array of branches"""
+    df = get_float_derivative(recursion)
+    lo, hi = window
+    grid = np.linspace(lo, hi, GRID)
+    sign = np.sign(df(grid))
+    # Grid nodes that land exactly on a critical point are cuts as they are
+    cuts = [x for x in grid[1:-1][sign[1:-1] == 0]]
+    for i in np.nonzero(sign[:-1] * sign[1:] < 0)[0]:
+        a, b = grid[i], grid[i + 1]
+        # Bisect f' to the critical point between two grid nodes
+        for _ in range(60):
+            m = 0.5 * (a + b)
+            if np.sign(df(m)) == np.sign(df(a)):
+                a = m
+            else:
+                b = m
+        cuts.append(0.5 * (a + b))
+    edges = np.array([lo] + sorted(cuts) + [hi])
+    return np.column_stack([edges[:-1], edges[1:]])
+
+
+def _solve_branch(f, df, y, a, b):
+    """Bracketed Newton for f(x) = y on one monotone branch [a, b]"""
+    fa, fb = f(np.array([a, b]))
+    lo_val, hi_val = min(fa, fb), max(fa, fb)
+    inside = (y >= lo_val) & (y <= hi_val)
+    x = np.full(y.shape, np.nan)
+    if not inside.any():
+        return x
+    t = y[inside]
+    left = np.full(t.shape, a)
+    right = np.full(t.shape, b)
+    increasing = fb >= fa
+    # Regula falsi start, then Newton, falling back to bisection
+    z = a + (t - fa) * (b - a) / (fb - fa) if fb != fa else np.full(t.shape, 0.5 * (a + b))
+    for _ in range(NEWTON_STEPS):
+        r = f(z) - t
+        below = (r < 0) == increasing
+        left = np.where(below, z, left)
+        right = np.where(below, right, z)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            newton = z - r / df(z)
+        bad = ~np.isfinite(newton) | (newton <= left) | (newton >= right)
+        z_next = np.where(bad, 0.5 * (left + right), newton)
+        if np.all(np.abs(z_next - z) <= 4 * np.finfo(np.float64).eps * np.maximum(np.abs(z), 1)):
+            z = z_next
+            break
+        z = z_next
+    x[inside] = z
+    return x
+
+
+def _principal_index(branches, recursion, branch):
+    if branch is None:
+        branch = float(solve_attractor(recursion, dps=20)['attractor'])
+    return int(np.clip(np.searchsorted(branches[:, 1], branch), 0, len(branches) - 1))
+
+
+def predecessors(values, recursion='logos', window=DEFAULT_WINDOW, branch=None):
+    """All predecessors of each value in the window, plus the principal one
+
+    `branch` is a point selecting the principal branch; by default the
+    branch holding the attractor, i.e. the one the forward ladder runs on.
+    """
+    f = _float_map(recursion)
+    df = get_float_derivative(recursion)
+    y = np.asarray(values, dtype=np.float64).ravel()
+    branches = monotone_branches(recursion, window)
+    index = _principal_index(branches, recursion, branch)
+
+    roots = np.column_stack([_solve_branch(f, df, y, a, b) for a, b in branches])
+    count = np.sum(np.isfinite(roots), axis=1)
+    return {
+        'branches': branches,
+        'roots': roots,
+        'count': count,
+        'ambiguous': count > 1,
+        'branch': index,
+        'principal': roots[:, index],
+    }
+
+
+def _digits_lost(df, path):
+    """Decimal digits the backward walk amplifies away, per row
+
+    Each inverse step multiplies an error by 1/|f'(ψ_{k-1})|, so the
+    loss is the sum of log10 of those factors along the path.
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        gain = -np.log10(np.abs(df(path[:, 1:])))
+    return np.nansum(np.where(np.isfinite(gain), gain, np.nan), axis=1)
+
+
+def walk_back(values, steps, recursion='logos', window=DEFAULT_WINDOW, branch=None, dps=None):
+    """(N, steps + 1) array ψ_n, ψ_{n-1}, ... along the principal branch
+
+    Entries become NaN once a value has no predecessor on that branch.
+    Near an attractor every backward step divides the error by the slope
+    (about 0.039 for 'logos'), so a float64 walk is only good for a few
+    steps. With `dps` each step is re-solved with mpmath Newton against
+    the previous mp value, the float walk serving only as start guesses,
+    and the result is an object array of mpf (None past a missing
+    predecessor). A RuntimeWarning is raised when the digits the walk
+    amplifies away exceed the working precision.
+    """
+    f = _float_map(recursion)
+    df = get_float_derivative(recursion)
+    branches = monotone_branches(recursion, window)
+    a, b = branches[_principal_index(branches, recursion, branch)]
+
+    targets = list(np.ravel(values)) if dps is not None else None
+    y = np.array([float(v) for v in np.ravel(values)], dtype=np.float64)
+    path = np.full((y.size, steps + 1), np.nan)
+    path[:, 0] = y
+    for k in range(1, steps + 1):
+        path[:, k] = _solve_branch(f, df, path[:, k - 1], a, b)
+
+    digits = dps if dps is not None else np.finfo(np.float64).precision
+    lost = _digits_lost(df, path)
+    if steps and np.nanmax(lost, initial=0) > digits:
+        warnings.warn(
+            f'walk_back: {steps} steps amplify errors by up to 10^{np.nanmax(lost):.1f}, '
+            f'more than the {digits} digits available; pass a larger dps',
+            RuntimeWarning, stacklevel=2)
+    if dps is None:
+        return path
+
+    exact = np.full(path.shape, None, dtype=object)
+    step = get_recursion(recursion)
+    with mp.workdps(dps):
+        for i, y0 in enumerate(targets):
+            x = mpf(y0)
+            exact[i, 0] = x
+            for k in range(1, steps + 1):
+                x0 = path[i, k]
+                if not np.isfinite(x0):
+                    break
+                target = x
+                x = findroot(lambda t: step(t) - target, mpf(x0))
+                exact[i, k] = x
+                # Later float guesses start from the refined value
+                if k < steps:
+                    path[i, k + 1] = _solve_branch(f, df, np.array([float(x)]), a, b)[0]
+    return exact
+
+
+def refine(roots, targets, dps=50, recursion='logos'):
+    """Polish one float predecessor per target with mpmath Newton (NaN -> None)
+
+    This is a single step; pass the targets as mpf (or strings) to keep
+    them exact, and use walk_back(dps=...) for multi-step walks.
+    """
+    f = get_recursion(recursion)
+    refined = []
+    with mp.workdps(dps):
+        for x0, y in zip(np.ravel(roots), targets):
+            if not np.isfinite(x0):
+                refined.append(None)
+                continue
+            y = mpf(y)
+            refined.append(findroot(lambda x: f(x) - y, mpf(float(x0))))
+    return refined
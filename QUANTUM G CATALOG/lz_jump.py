@@ -0,0 +1,304 @@
+from functools import lru_cache
+from itertools import islice
+from mpmath import mp, mpf, mpc, sqrt, log, factorial, nstr
+
+from lz_maps import KAPPA_SEED, asin_step
+from lz_sequence import iter_lz
+from lz_fixed_point import GUARD_DPS, solve_attractor
+
+"""
+LOGOS THEORY - JUMP-AHEAD LZ LEVELS
+Author: Martin Doina
+
+Evaluates LZ_n for huge n (10^9 and beyond) without walking the ladder.
+The tail is fitted once from exact iterates and checked at a second,
+later checkpoint; after that any level costs a few series evaluations.
+
+  'logos' : geometric tail, |LZ_n - LZ_∞| ~ 0.0387^n. The ladder reaches the
+            attractor to working precision after ~0.7·dps steps, so every
+            later level IS the (Newton-solved) attractor.
+  'sine'  : parabolic tail, LZ_n ~ sqrt(3/n). The Fatou coordinate
+              F(x) = 3/x² + (6/5) ln x + Σ b_k x^(2k),   F(sin x) = F(x) + 1
+            turns n steps into a shift: F(LZ_n) = n + C, solved for LZ_n
+            by Newton. The b_k come from the sine series; the series is
+            asymptotic, so the checkpoint is placed where it is accurate.
+
+The complex upward chain z ← asin(z) runs the sine map backwards, so the
+same F continued to complex z gives F(LZ-k) = C - k (fit_upward).
+"""
+
+
+@lru_cache(maxsize=None)
+def _fatou_coefficients(terms, dps):
+    """b_1 .. b_terms of the sine Fatou coordinate, as mpf at dps"""
+    n = terms + 3
+    with mp.workdps(dps):
+        # g(u) = (sin x / x)² as a series in u = x²
+        s = [mpf((-1) ** k) / factorial(2 * k + 1) for k in range(n)]
+        g = [sum(s[i] * s[m - i] for i in range(m + 1)) for m in range(n)]
+        inv = [mpf(1)] + [mpf(0)] * (n - 1)
+        for m in range(1, n):
+            inv[m] = -sum(g[i] * inv[m - i] for i in range(1, m + 1))
+        # ln g from (ln g)' = g'/g
+        dg = [(i + 1) * g[i + 1] for i in range(n - 1)]
+        q = [sum(dg[i] * inv[m - i] for i in range(m + 1)) for m in range(n - 1)]
+        lng = [mpf(0)] + [q[i] / (i + 1) for i in range(n - 1)]
+        # F(sin x) - F(x) - 1 from the 3/x² and (6/5) ln x terms alone
+        base = [3 * inv[m + 1] + mpf(3) / 5 * lng[m] for m in range(n - 1)]
+
+        # powers[k] = g^k, only to the degree the u^(terms+1) balance needs
+        powers = [None, g]
+        for k in range(2, terms + 1):
+            prev = powers[-1]
+            powers.append([sum(prev[i] * g[m - i] for i in range(m + 1)) for m in range(terms + 2 - k)])
+        b = [mpf(0)] * (terms + 1)
+        for m in range(2, terms + 2):
+            # b_{m-1} enters u^m with factor [u^1](g^(m-1) - 1) = -(m-1)/3
+            rest = base[m] + sum(b[k] * powers[k][m - k] for k in range(1, m - 1))
+            b[m - 1] = 3 * rest / (m - 1)
+        return tuple(b[1:])
+
+
+def _fatou(x, coefficients):
+    """F(x) and F'(x) at the current precision (x > 0, or complex off the negative axis)"""
+    u = x * x
+    value = 3 / u + mpf(6) / 5 * log(x)
+    slope = -6 / (u * x) + mpf(6) / (5 * x)
+    power = u
+    for k, b in enumerate(coefficients, 1):
+        value += b * power
+        slope += 2 * k * b * power / x
+        power *= u
+    return value, slope
+
+
+def _shifted_dps(work, n):
+    # F(LZ_n) ≈ n, so n's digits come on top of the working precision
+    return work + len(str(max(int(n), 1)))
+
+
+def _settle_limit(slope, work):
+    """Iteration cap for reaching the attractor to `work` digits
+
+    A contraction by |slope| gains -log10|slope| digits per step; allow
+    twice that many steps plus a margin for the approach from the seed.
+    """
+    with mp.workdps(work):
+        rate = -mp.log10(abs(slope)) if slope != 0 else mpf(work)
+    if rate <= 0:
+        return 0
+    return 2 * int(mp.ceil(work / rate)) + 100
+
+
+def _fit_attracting(seed, dps, recursion, max_steps=None):
+    work = dps + GUARD_DPS
+    solved = solve_attractor(recursion, work, seed)
+    if solved['kind'] not in ('attracting', 'parabolic'):
+        raise ValueError(f"'{recursion}' has a {solved['kind']} fixed point at "
+                         f"{mp.nstr(solved['attractor'], 10)} (slope {mp.nstr(solved['slope'], 5)}); "
+                         "the ladder does not converge to it")
+    fixed = solved['attractor']
+    if max_steps is None:
+        max_steps = _settle_limit(solved['slope'], work) if solved['kind'] == 'attracting' else 100 * work
+    with mp.workdps(work):
+        tol = mpf(10) ** (-work) * max(abs(fixed), 1)
+    levels = []
+    for value in islice(iter_lz(seed, work, recursion), max_steps + 1):
+        levels.append(value)
+        if abs(value - fixed) <= tol:
+            break
+    else:
+        raise ValueError(f"'{recursion}' ladder from {seed} did not settle on {mp.nstr(fixed, 10)} "
+                         f"to {work} digits in {max_steps} steps")
+    # Verify at a second checkpoint: the iterates must stay on the attractor
+    check = next(islice(iter_lz(levels[-1], work, recursion), len(levels), None))
+    with mp.workdps(work):
+        error = abs(check - fixed) / max(abs(fixed), 1)
+        verified = work if error == 0 else int(-mp.log10(error))
+    return {
+        'kind': 'attracting',
+        'attractor': fixed,
+        'settle': len(levels) - 1,
+        'levels': levels,
+        'verified_digits': min(verified, dps),
+    }
+
+
+def _fit_parabolic(seed, dps, checkpoint=None):
+    work = dps + GUARD_DPS
+    terms = max(12, work // 3)
+    coefficients = _fatou_coefficients(terms, work + GUARD_DPS)
+    n1 = checkpoint or 2 * work
+    stream = iter_lz(seed, work, 'sine')
+    x = next(islice(stream, n1, None))
+    n = n1
+    while True:
+        # C from two checkpoints; their difference is the series error at n1
+        n2 = 2 * n
+        y = next(islice(stream, n2 - n - 1, None))
+        with mp.workdps(_shifted_dps(work, n2)):
+            c1 = _fatou(abs(x), coefficients)[0] - n
+            c2 = _fatou(abs(y), coefficients)[0] - n2
+            # δLZ_n / LZ_n ≈ δC / (2n)
+            error = abs(c1 - c2) / (2 * n2)
+        if error <= mpf(10) ** (-(dps + 2)):
+            break
+        x, n = y, n2
+    return {
+        'kind': 'parabolic',
+        'fatou_constant': c2,
+        'checkpoint': n2,
+        'checkpoint_level': y,
+        'sign': -1 if y < 0 else 1,
+        'terms': terms,
+        'verified_digits': min(dps, int(-mp.log10(error))) if error else dps,
+    }
+
+
+def fit_tail(seed=KAPPA_SEED, dps=100, recursion='logos', checkpoint=None):
+    """Fit the jump-ahead tail of an LZ ladder; pass the result to jump_level"""
+    seed = str(seed)
+    if recursion == 'sine':
+        fit = _fit_parabolic(seed, dps, checkpoint)
+    else:
+        fit = _fit_attracting(seed, dps, recursion)
+    fit.update(recursion=recursion, seed=seed, dps=dps)
+    return fit
+
+
+def _level(fit, n):
+    """LZ_n at working precision (dps + GUARD_DPS)"""
+    work = fit['dps'] + GUARD_DPS
+    if n < 0:
+        raise ValueError(f"Level index must be non-negative, got {n}")
+    if fit['kind'] == 'attracting':
+        return fit['levels'][n] if n < len(fit['levels']) else fit['attractor']
+    if n == fit['checkpoint']:
+        return fit['checkpoint_level']
+    if n < fit['checkpoint']:
+        # Before the checkpoint the exact ladder is the cheapest answer
+        return next(islice(iter_lz(fit['seed'], work, 'sine'), n, None))
+
+    coefficients = _fatou_coefficients(fit['terms'], work + GUARD_DPS)
+    with mp.workdps(_shifted_dps(work, n)):
+        target = n + fit['fatou_constant']
+        x = sqrt(3 / target)
+        tol = mpf(10) ** (-work)
+        for _ in range(100):
+            value, slope = _fatou(x, coefficients)
+            step = (value - target) / slope
+            x -= step
+            if abs(step) <= tol * x:
+                break
+        x = fit['sign'] * x
+    with mp.workdps(work):
+        return +x
+
+
+def jump_level(fit, n):
+    """LZ_n at the fitted precision, for any n (10^9, 10^30, ...)"""
+    value = _level(fit, n)
+    with mp.workdps(fit['dps']):
+        return +value
+
+
+def jump_levels(fit, n0, n1, step=1):
+    """Yield LZ_n for n in range(n0, n1, step)
+
+    Unit steps jump once to n0 and then iterate the recursion exactly;
+    wider strides jump to every level independently.
+    """
+    if step != 1:
+        for n in range(n0, n1, step):
+            yield jump_level(fit, n)
+        return
+    work = fit['dps'] + GUARD_DPS
+    for value in islice(iter_lz(_level(fit, n0), work, fit['recursion']), n1 - n0):
+        with mp.workdps(fit['dps']):
+            yield +value
+
+
+def _upward_chain(seed, work):
+    """LZ-1, LZ-2, ... at `work` dps"""
+    with mp.workdps(work):
+        z = asin_step(mpf(seed))
+    while True:
+        with mp.workdps(work):
+            z = mpc(asin_step(z))
+        yield z
+
+
+def fit_upward(seed=KAPPA_SEED, dps=50, checkpoint=None):
+    """Fit F(LZ-k) = C - k for the upward chain; pass the result to jump_upward"""
+    seed = str(seed)
+    work = dps + GUARD_DPS
+    terms = max(12, work // 3)
+    coefficients = _fatou_coefficients(terms, work + GUARD_DPS)
+    n = checkpoint or 2 * work
+    stream = _upward_chain(seed, work)
+    x = next(islice(stream, n - 1, None))
+    while True:
+        n2 = 2 * n
+        y = next(islice(stream, n2 - n - 1, None))
+        with mp.workdps(_shifted_dps(work, n2)):
+            c1 = _fatou(x, coefficients)[0] + n
+            c2 = _fatou(y, coefficients)[0] + n2
+            error = abs(c1 - c2) / (2 * n2)
+        if error <= mpf(10) ** (-(dps + 2)):
+            break
+        x, n = y, n2
+    return {
+        'recursion': 'asin',
+        'seed': seed,
+        'dps': dps,
+        'kind': 'parabolic',
+        'fatou_constant': c2,
+        'checkpoint': n2,
+        'checkpoint_level': y,
+        'terms': terms,
+        'verified_digits': min(dps, int(-mp.log10(error))) if error else dps,
+    }
+
+
+def jump_upward(fit, k):
+    """LZ-k of the upward chain (k >= 1) at the fitted precision, for any k"""
+    work = fit['dps'] + GUARD_DPS
+    if k < 1:
+        raise ValueError(f"Upward levels start at LZ-1, got LZ-{k}")
+    if k == fit['checkpoint']:
+        z = fit['checkpoint_level']
+    elif k < fit['checkpoint']:
+        z = next(islice(_upward_chain(fit['seed'], work), k - 1, None))
+    else:
+        coefficients = _fatou_coefficients(fit['terms'], work + GUARD_DPS)
+        with mp.workdps(_shifted_dps(work, k)):
+            target = fit['fatou_constant'] - k
+            # 3/z² ≈ C - k: of the two roots take the petal the chain is in,
+            # i.e. the one on the checkpoint level's side
+            z = sqrt(mpc(3) / target)
+            if mp.re(z * mp.conj(fit['checkpoint_level'])) < 0:
+                z = -z
+            tol = mpf(10) ** (-work)
+            for _ in range(100):
+                value, slope = _fatou(z, coefficients)
+                step = (value - target) / slope
+                z -= step
+                if abs(step) <= tol * abs(z):
+                    break
+    with mp.workdps(fit['dps']):
+        return +z
+
+
+if __name__ == "__main__":
+    print("JUMP-AHEAD LZ LEVELS")
+    print("=" * 80)
+    for recursion in ('logos', 'sine'):
+        fit = fit_tail(KAPPA_SEED, 50, recursion)
+        print(f"\n{recursion}: {fit['kind']} tail, verified to {fit['verified_digits']} digits")
+        for n in (10, 10 ** 3, 10 ** 6, 10 ** 9, 10 ** 30):
+            print(f"  LZ_{n:<8.0e} = {nstr(jump_level(fit, n), 40)}")
+
+    fit = fit_upward(KAPPA_SEED, 50)
+    print(f"\nasin upward chain: verified to {fit['verified_digits']} digits")
+    for k in (10, 10 ** 3, 10 ** 6, 10 ** 9, 10 ** 30):
+        print(f"  LZ-{k:<8.0e} = {nstr(jump_upward(fit, k), 30)}")
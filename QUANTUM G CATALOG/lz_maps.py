@@ -0,0 +1,267 @@
+import ast
+import inspect
+from contextlib import contextmanager
+
+import numpy as np
+from mpmath import mp, iv, asin, conj
+
+"""
+LOGOS THEORY - LZ RECURSION MAPS
+Author: Martin Doina
+
+The two recursions used across the catalogs:
+  'logos' : ψ ← sin(ψ) + exp(-ψ)   (generate_lz_constants.py, _compute_LZ_attractors)
+  'sine'  : ψ ← sin(ψ)             (the hand-pasted LZ0..LZ45 catalog ladder)
+The complex upward levels LZ-n come from asin_step, z ← asin(z).
+
+Both are members of declared recursion families. A family is a plain
+function f(x, ctx, **parameters) written against a backend namespace:
+NumPy arrays (float64, parameters may be arrays for bulk sweeps) or an
+mpmath context (mp, iv, or a private MPContext). The same definition
+gives every kernel the LZ modules look up by name.
+"""
+
+# LOGOS seed ψ(0) as printed in the catalogs (exact decimal string)
+KAPPA_SEED = '0.8934691018292812244027'
+
+# The 200-digit κ_curvature used by the CODE/ calculator apps
+KAPPA_CURVATURE = ('0.89346910182928122440279572673405182041647692165005360826396612021750'
+                   '136786527281441168556535164677694494186786456144766863123663458741007'
+                   '120975502575656212798318142106035303596684743081226484093826986')
+
+
+class _NumPy:
+    """NumPy under the mpmath names the family functions use (ctx.sin, ...)"""
+
+    sin, cos, tan, asin = np.sin, np.cos, np.tan, np.arcsin
+    exp, log, sqrt = np.exp, np.log, np.sqrt
+    pi = np.pi
+    mpf = float
+
+
+_NUMPY = _NumPy()
+
+
+def _backend(ctx):
+    return _NUMPY if ctx is np else ctx
+
+
+def compile_expression(expression, args, namespace, name='expression'):
+    """Expression (source or ast.expr) in `args` -> a plain function over them
+
+    Compiled once; the names the expression uses besides its arguments are
+    looked up in `namespace`, which becomes the function's globals. Zoo
+    feature kinds and catalog transformations turn their declared
+    expressions into kernels this way.
+    """
+    body = ast.parse(expression, mode='eval').body if isinstance(expression, str) else expression
+    arguments = ast.arguments(posonlyargs=[], args=[ast.arg(a) for a in args], kwonlyargs=[],
+                              kw_defaults=[], defaults=[])
+    tree = ast.fix_missing_locations(ast.Expression(ast.Lambda(arguments, body)))
+    label = expression if isinstance(expression, str) else ast.unparse(expression)
+    return eval(compile(tree, f'<{name} {label}>', 'eval'), dict(namespace))
+
+
+class RecursionFamily:
+    """ψ ← function(ψ, ctx, **parameters), declared once for every backend
+
+    The keyword defaults of `function` are the family parameters.
+    `derivative` has the same signature. `columns(ctx, **parameters)` is an
+    optional hook returning the step as g(sin ψ, exp(-ψ)), or None for
+    members that need anything else.
+    """
+
+    def __init__(self, function, derivative=None, columns=None):
+        self.function = function
+        self.derivative = derivative
+        self.columns = columns
+        # f(x, ctx, a=..., b=...): everything after (x, ctx) is a parameter
+        self.defaults = {name: p.default for name, p in
+                         list(inspect.signature(function).parameters.items())[2:]}
+
+    def __repr__(self):
+        params = ', '.join(f'{k}={v!r}' for k, v in self.defaults.items())
+        return f"RecursionFamily({self.function.__name__}, {params})"
+
+    def _check(self, params):
+        for name in params:
+            if name not in self.defaults:
+                raise TypeError(f"{self!r} has no parameter '{name}'")
+
+    def _params(self, params, ctx):
+        self._check(params)
+        # Decimal strings stay exact under mpmath
+        return {name: ctx.mpf(v) if isinstance(v, str) else v
+                for name, v in {**self.defaults, **params}.items()}
+
+    def evaluate(self, x, ctx=mp, **params):
+        """f(x) under ctx (np, mp, iv, ...) with parameters overriding the defaults"""
+        ctx = _backend(ctx)
+        return self.function(x, ctx, **self._params(params, ctx))
+
+    def slope(self, x, ctx=mp, **params):
+        """f'(x) under ctx; complex-step (NumPy) or ctx.diff when no derivative is declared"""
+        if self.derivative is not None:
+            ctx = _backend(ctx)
+            return self.derivative(x, ctx, **self._params(params, ctx))
+        if ctx is np:
+            h = 1e-20
+            return np.imag(self.evaluate(np.asarray(x) + 1j * h, np, **params)) / h
+        return ctx.diff(lambda t: self.evaluate(t, ctx, **params), x)
+
+    def bind(self, **params):
+        """Fix the parameters -> BoundRecursion with ready-made kernels"""
+        return BoundRecursion(self, params)
+
+
+class BoundRecursion:
+    """One member of a family, exposing the kernel signatures the LZ modules use"""
+
+    def __init__(self, family, params):
+        family._check(params)
+        self.family = family
+        self.params = params
+        self._fixed = {**family.defaults, **params}
+        # Decimal strings are read at the working precision of each call
+        self._strings = any(isinstance(v, str) for v in self._fixed.values())
+        self._float = family._params(params, _NUMPY)
+
+    def __repr__(self):
+        return f"{self.family!r}.bind({self.params!r})"
+
+    def _values(self, ctx):
+        return self.family._params(self.params, ctx) if self._strings else self._fixed
+
+    def mp_map(self, x, ctx=mp):
+        return self.family.function(x, ctx, **self._values(ctx))
+
+    def mp_slope(self, x, ctx=mp):
+        if self.family.derivative is None:
+            return self.family.slope(x, ctx, **self.params)
+        return self.family.derivative(x, ctx, **self._values(ctx))
+
+    def float_map(self, x, out):
+        out[...] = self.family.function(x, _NUMPY, **self._float)
+        return out
+
+    def float_slope(self, x):
+        if self.family.derivative is None:
+            return self.family.slope(x, np, **self.params)
+        return self.family.derivative(x, _NUMPY, **self._float)
+
+    def column_step(self, ctx=mp):
+        """g(sin x, exp(-x)) -> f(x) under ctx, or None if the family has no such form
+
+        Lets a caller that already needs sin ψ and exp(-ψ) (HQS_n) take the
+        step without evaluating them twice.
+        """
+        hook = self.family.columns
+        if hook is None or hook(ctx, **self._values(ctx)) is None:
+            return None
+        if not self._strings:
+            return hook(ctx, **self._fixed)
+        return lambda s, e: hook(ctx, **self._values(ctx))(s, e)
+
+
+def logos(x, ctx, a=1, b=1, c=1):
+    return a * ctx.sin(x) + b * ctx.exp(-c * x)
+
+
+def logos_slope(x, ctx, a=1, b=1, c=1):
+    return a * ctx.cos(x) - b * c * ctx.exp(-c * x)
+
+
+def logos_columns(ctx, a=1, b=1, c=1):
+    # exp(-c x) is the shared exp(-x) column only for c = 1
+    if c != 1:
+        return None
+    return lambda s, e: a * s + b * e
+
+
+def sine(x, ctx, a=1):
+    return a * ctx.sin(x)
+
+
+def sine_slope(x, ctx, a=1):
+    return a * ctx.cos(x)
+
+
+def sine_columns(ctx, a=1):
+    return lambda s, e: a * s
+
+
+LOGOS_FAMILY = RecursionFamily(logos, logos_slope, logos_columns)
+SINE_FAMILY = RecursionFamily(sine, sine_slope, sine_columns)
+
+MAPS = {
+    'logos': LOGOS_FAMILY.bind(),
+    'sine': SINE_FAMILY.bind(),
+}
+
+# Kernel tables keyed by recursion name. The mpmath maps take an optional
+# context so the same definition also runs under mpmath.iv; the float64
+# maps write into `out` (which must not alias x).
+RECURSIONS = {name: m.mp_map for name, m in MAPS.items()}
+DERIVATIVES = {name: m.mp_slope for name, m in MAPS.items()}
+FLOAT_RECURSIONS = {name: m.float_map for name, m in MAPS.items()}
+FLOAT_DERIVATIVES = {name: m.float_slope for name, m in MAPS.items()}
+
+
+def register_recursion(name, bound):
+    """Make a BoundRecursion available to every LZ module under `name`"""
+    MAPS[name] = bound
+    RECURSIONS[name] = bound.mp_map
+    DERIVATIVES[name] = bound.mp_slope
+    FLOAT_RECURSIONS[name] = bound.float_map
+    FLOAT_DERIVATIVES[name] = bound.float_slope
+
+
+def _lookup(table, name):
+    try:
+        return table[name]
+    except KeyError:
+        raise ValueError(f"Unknown LZ recursion '{name}' (expected one of {sorted(table)})")
+
+
+def get_recursion(name):
+    """Look up a recursion map by name"""
+    return _lookup(RECURSIONS, name)
+
+
+def get_derivative(name):
+    """Look up the derivative of a recursion map by name"""
+    return _lookup(DERIVATIVES, name)
+
+
+def get_float_recursion(name):
+    """Look up the float64 NumPy kernel of a recursion map by name"""
+    return _lookup(FLOAT_RECURSIONS, name)
+
+
+def get_float_derivative(name):
+    """Look up the float64 NumPy derivative of a recursion map by name"""
+    return _lookup(FLOAT_DERIVATIVES, name)
+
+
+def asin_step(z):
+    """One upward step z ← asin(z) with cmath's branch convention
+
+    For real arguments beyond ±1 cmath (and NumPy) take the upper side of
+    the cut, mpmath the lower side for z > 1; asin keeps the sign of the
+    imaginary part, so fixing it at the cut fixes the whole chain.
+    """
+    w = asin(z)
+    if mp.im(z) == 0 and mp.im(w) < 0:
+        w = conj(w)
+    return w
+
+
+@contextmanager
+def iv_workdps(dps):
+    """mp.workdps equivalent for the mpmath.iv interval context"""
+    saved = iv.prec
+    iv.dps = dps
+    try:
+        yield
+    finally:
+        iv.prec = saved
@@ -0,0 +1,227 @@
+import os
+import sys
+import time
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
+from mpmath import mp, mpf, exp
+
+from lz_maps import KAPPA_SEED, get_recursion, get_derivative
+from lz_sequence import iter_lz, take_lz
+from lz_fixed_point import GUARD_DPS
+
+"""
+LOGOS THEORY - PARALLEL-IN-TIME (PARAREAL) LZ LADDER
+Author: Martin Doina
+
+At 10,000 digits every LZ step is expensive and the ladder is strictly
+sequential. Parareal splits it into segments: a cheap coarse propagator
+(low dps) guesses every segment start, worker processes run the fine
+propagator on all segments at once, and the starts are corrected
+
+  U_{j+1} ← F(U_j_old) + F'(U_j_old)·(U_j_new - U_j_old)
+
+The classic G(U_new) - G(U_old) term vanishes once the start shifts sit
+below the coarse precision, so the workers also return the segment's
+derivative product F' = Π f'(ψ_k), taken at half precision along the fine
+path. That makes the correction a Newton (multiple-shooting) step: the
+number of correct digits at each start roughly doubles per round, so the
+fine runs of round r only need about 2^r · COARSE_DPS digits. The starts
+are converged this way at reduced (doubling) precision, then every
+segment gets one exact fine pass at the requested dps.
+
+An approximate start still leaves its segment off the serial ladder by an
+ulp or so. Under a contracting map ('logos') that difference dies out
+within a few steps, after which the fine segment coincides bit for bit
+with the serial one; the main process walks those few steps serially from
+the previous segment's exact end and splices. Maps that do not contract
+over a segment ('sine', parabolic) never merge, so they are run serially.
+
+The rounds number about log2(dps / COARSE_DPS), whatever the segment count.
+All told the fine work comes to about three serial ladders (the doubling
+rounds, dominated by the last, plus the exact pass) spread over the
+workers, so parareal pays off from four or so workers up; compare_serial
+times both on the same ladder.
+"""
+
+COARSE_DPS = 20
+# A segment whose coarse |F'| stays above this cannot absorb an ulp of
+# start error; the ladder is then cheaper to run serially
+MERGE_CONTRACTION = mpf('1e-3')
+MAX_ROUNDS = 50
+
+
+def _gain_dps(dps):
+    return dps // 2 + COARSE_DPS
+
+
+def _fine_segment(job):
+    """Worker: start and `steps` levels after it at dps, plus dF/dU, as raw _mpf_ tuples"""
+    start, steps, dps, recursion, with_gain = job
+    slope = get_derivative(recursion)
+    with mp.workdps(dps):
+        value = mp.make_mpf(start)
+    levels = []
+    gain = mpf(1)
+    for v in islice(iter_lz(value, dps, recursion), steps + 1):
+        if with_gain and len(levels) < steps:
+            with mp.workdps(_gain_dps(dps)):
+                gain *= slope(v)
+        levels.append(v)
+    # Tuples cross the process boundary exactly; pickled mpf would not
+    return [t._mpf_ for t in levels], gain._mpf_
+
+
+def _coarse(value, steps, recursion):
+    """G: the same recursion run at COARSE_DPS -> (end, |Π f'| along the way)"""
+    slope = get_derivative(recursion)
+    contraction = mpf(1)
+    for k, v in enumerate(iter_lz(value, COARSE_DPS, recursion)):
+        if k == steps:
+            return v, contraction
+        with mp.workdps(COARSE_DPS):
+            contraction *= abs(slope(v))
+
+
+def _boundaries(depth, segments):
+    # Level indices where segments start; the last entry is the final level
+    return sorted({round(j * (depth - 1) / segments) for j in range(segments + 1)})
+
+
+def _converge_starts(pool, starts, steps, work, recursion):
+    """Newton-parareal rounds at doubling precision until the starts are good to `work` digits"""
+    precision = COARSE_DPS
+    rounds = runs = 0
+    while rounds < MAX_ROUNDS:
+        rounds += 1
+        precision = min(2 * precision, work)
+        jobs = [(u._mpf_, n, precision, recursion, True) for u, n in zip(starts[:-1], steps[:-1])]
+        results = list(pool.map(_fine_segment, jobs))
+        runs += len(jobs)
+
+        new_starts = [starts[0]]
+        shift = mpf(0)
+        with mp.workdps(work):
+            for j, (levels, gain) in enumerate(results):
+                end = mp.make_mpf(levels[-1])
+                new_starts.append(end + mp.make_mpf(gain) * (new_starts[j] - starts[j]))
+                shift = max(shift, abs(new_starts[-1] - starts[j + 1]) / max(abs(new_starts[-1]), 1))
+        starts = new_starts
+        # Quadratic convergence: a shift below half the digits means the
+        # new starts are as good as this round's precision allows
+        if shift <= mpf(10) ** (-(precision // 2)) and precision == work:
+            break
+    return starts, rounds, runs
+
+
+def parareal_lz(depth, seed=KAPPA_SEED, dps=100, recursion='logos', segments=None, workers=None):
+    """LZ_0 .. LZ_{depth-1} identical to take_lz, fine-propagated in parallel
+
+    Returns {'levels', 'iterations', 'segments', 'fine_runs', 'repaired',
+    'serial'}: correction rounds, segment runs (all precisions), levels
+    recomputed serially at the seams, and whether the map forced a serial run.
+    """
+    workers = workers or os.cpu_count() or 1
+    edges = _boundaries(depth, segments or workers)
+    steps = [b - a for a, b in zip(edges, edges[1:])]
+    with mp.workdps(dps):
+        seed_value = mpf(seed)
+    if depth <= 1:
+        return {'levels': [seed_value][:depth], 'iterations': 0, 'segments': 0, 'fine_runs': 0,
+                'repaired': 0, 'serial': False}
+
+    # Initial starts from the coarse propagator alone
+    work = dps + GUARD_DPS
+    starts = [seed_value]
+    contractions = []
+    for n in steps:
+        end, contraction = _coarse(starts[-1], n, recursion)
+        contractions.append(contraction)
+        with mp.workdps(work):
+            starts.append(mpf(end))
+    starts.pop()
+    # The first segment starts from the exact seed; every later one must merge
+    if len(steps) == 1 or any(c > MERGE_CONTRACTION for c in contractions[1:]):
+        return {'levels': take_lz(depth, seed, dps, recursion), 'iterations': 0, 'segments': 1,
+                'fine_runs': 0, 'repaired': depth - 1, 'serial': True}
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        starts, rounds, runs = _converge_starts(pool, starts, steps, work, recursion)
+        # One exact pass: every segment at dps from its converged start
+        jobs = [(u._mpf_, n, dps, recursion, False) for u, n in zip(starts, steps)]
+        fine = [levels for levels, _ in pool.map(_fine_segment, jobs)]
+        runs += len(jobs)
+
+    # Splice: walk serially from each exact seam until the fine segment agrees
+    step = get_recursion(recursion)
+    repaired = 0
+    with mp.workdps(dps):
+        levels = [mp.make_mpf(fine[0][0])]
+    for segment in fine:
+        if segment[0] != levels[-1]._mpf_:
+            repaired += _repair(segment, levels, step, dps)
+        with mp.workdps(dps):
+            levels.extend(mp.make_mpf(t) for t in segment[1:])
+    return {'levels': levels, 'iterations': rounds, 'segments': len(steps), 'fine_runs': runs,
+            'repaired': repaired, 'serial': False}
+
+
+def _repair(segment, levels, step, dps):
+    """Rewrite `segment` serially from the exact levels[-1] until it merges -> steps taken
+
+    At the attractor the rounded ladder can settle on a different ulp-level
+    fixed point or 2-cycle than an approximate start reaches, and then the
+    two never merge; the serial walk stops there and repeats the cycle.
+    """
+    recent = [t._mpf_ for t in levels[-2:]]
+    value = levels[-1]
+    segment[0] = value._mpf_
+    for k in range(1, len(segment)):
+        with mp.workdps(dps):
+            value = step(value)
+        if value._mpf_ == segment[k]:
+            return k
+        segment[k] = value._mpf_
+        for period in (1, 2):
+            if len(recent) >= period and recent[-period] == value._mpf_:
+                for i in range(k + 1, len(segment)):
+                    segment[i] = segment[i - period]
+                return k
+        recent = recent[-1:] + [value._mpf_]
+    return len(segment) - 1
+
+
+def compare_serial(depth, seed=KAPPA_SEED, dps=100, recursion='logos', segments=None, workers=None):
+    """Wall-clock seconds of take_lz and parareal_lz on the same ladder, checked identical"""
+    t0 = time.perf_counter()
+    serial = take_lz(depth, seed, dps, recursion)
+    t1 = time.perf_counter()
+    result = parareal_lz(depth, seed, dps, recursion, segments, workers)
+    t2 = time.perf_counter()
+    if [v._mpf_ for v in result['levels']] != [v._mpf_ for v in serial]:
+        raise AssertionError("parareal levels differ from the serial ladder")
+    return {**result, 'serial_seconds': t1 - t0, 'parareal_seconds': t2 - t1,
+            'speedup': (t1 - t0) / (t2 - t1)}
+
+
+if __name__ == "__main__":
+    # Same listing as generate_lz_constants.py: python lz_parareal.py [depth] [dps] [workers]
+    depth = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    dps = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else None
+    mp.dps = dps
+    result = compare_serial(depth, KAPPA_SEED, dps, 'logos', workers=workers)
+
+    print(f"LOGOS EXACT LZ & HQS VALUES ({dps} decimals):")
+    print("=" * 85)
+    for i, val in enumerate(result['levels']):
+        print(f"LZ_{i} = {val}")
+
+    print("\nHQS VALUES for each LZ:")
+    print("=" * 85)
+    for i, val in enumerate(result['levels']):
+        hqs = exp(-val) / val
+        print(f"HQS_{i} = {hqs}")
+    print(f"\nParareal: {result['iterations']} rounds, {result['fine_runs']} fine runs "
+          f"over {result['segments']} segments, {result['repaired']} levels repaired; "
+          f"{result['parareal_seconds']:.3f}s vs {result['serial_seconds']:.3f}s serial "
+          f"({result['speedup']:.2f}x)", file=sys.stderr)
@@ -0,0 +1,128 @@
+import numpy as np
+
+"""
+LOGOS THEORY - HEADLESS LZ / HQS RENDERING
+Author: Martin Doina
+
+Writes sequence plots straight to image files (Agg backend, no window).
+Long runs are reduced with largest-triangle-three-buckets (LTTB), which
+keeps the visual shape (peaks, kinks, the approach to the attractor) while
+drawing only a few thousand points.
+"""
+
+DEFAULT_POINTS = 2000
+
+
+def lttb(x, y, threshold=DEFAULT_POINTS):
+    """Largest-triangle-three-buckets downsampling -> (x, y) of ≤ threshold points"""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = x.size
+    if threshold >= n or threshold < 3:
+        return x, y
+
+    # Bucket edges for the n - 2 interior points
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    keep = np.empty(threshold, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # Average of the next bucket (or the last point) is the third vertex
+        nlo, nhi = edges[i + 1], edges[i + 2] if i + 2 < len(edges) else n
+        cx = x[nlo:nhi].mean()
+        cy = y[nlo:nhi].mean()
+        area = np.abs((x[a] - cx) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (cy - y[a]))
+        a = lo + int(np.argmax(area))
+        keep[i + 1] = a
+    return x[keep], y[keep]
+
+
+def render_sequence(path, values, title="LOGOS Recursive Wave Function Evolution",
+                    ylabel="Wave Function Ψ(n)", label="Ψ(n) Evolution",
+                    points=DEFAULT_POINTS, logx=False, logy=False, offset=None):
+    """Plot a level sequence (any iterable of numbers) to an image file
+
+    offset: subtract a reference (e.g. the attractor) before plotting so
+    logy shows the approach |Ψ(n) - offset| on a log scale.
+    """
+    # Figure + Agg canvas directly: no pyplot state, no GUI backend needed
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    if isinstance(values, np.ndarray):
+        y = values.astype(np.float64, copy=False).ravel()
+    else:
+        # mpf levels are converted one by one; arrays skip this
+        y = np.fromiter((float(v) for v in values), dtype=np.float64)
+    x = np.arange(y.size, dtype=np.float64)
+    if offset is not None:
+        y = np.abs(y - float(offset))
+    if logx:
+        # Level 0 has no place on a log axis
+        x, y = x[1:], y[1:]
+    if logy:
+        mask = y > 0
+        x, y = x[mask], y[mask]
+    if logx and x.size > 4 * points:
+        # LTTB buckets are equal in count; thin geometrically first so the
+        # early levels are not lumped into a single bucket on a log axis
+        pick = np.unique(np.geomspace(1, x.size, 4 * points).astype(np.int64) - 1)
+        x, y = x[pick], y[pick]
+    # Downsample in the plotted coordinates so log axes keep their detail
+    sx = np.log10(x) if logx else x
+    sy = np.log10(y) if logy else y
+    sx, sy = lttb(sx, sy, points)
+    x = 10 ** sx if logx else sx
+    y = 10 ** sy if logy else sy
+
+    fig = Figure(figsize=(8, 4))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    ax.plot(x, y, marker="o" if x.size <= 100 else None, linestyle="-", color="blue", label=label)
+    if logx:
+        ax.set_xscale('log')
+    if logy:
+        ax.set_yscale('log')
+    ax.set_xlabel("Recursion Level (n)")
+    ax.set_ylabel(ylabel)
+    ax.set_title(title)
+    ax.legend()
+    ax.grid(True)
+    fig.savefig(path, dpi=120, bbox_inches='tight')
+    return path
+
+
+# Base colours per basin behaviour (UNCAPTURED, UPPER, LOWER, NONFINITE)
+BASIN_COLOURS = np.array([[0.0, 0.0, 0.0], [0.15, 0.35, 0.9], [0.9, 0.3, 0.15], [1.0, 1.0, 1.0]])
+
+
+def render_basin(path, basin, region, title="asin upward map: basins of the complex plane",
+                 max_side=4096):
+    """Colour a lz_basin map: hue by behaviour, lighter where REAL-dominant
+    levels prevail, darker the more iterations a pixel needed
+
+    Maps larger than max_side pixels per side are strided down first, so a
+    16k × 16k memmap is rendered without loading it whole.
+    """
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    stride = max(1, -(-max(basin.shape) // max_side))
+    view = np.asarray(basin[::stride, ::stride])
+    iterations = view['iterations'].astype(np.float64)
+    real_share = view['real_levels'] / np.maximum(iterations, 1)
+    shade = 1 - 0.75 * np.log1p(iterations) / np.log1p(max(iterations.max(), 1))
+    rgb = BASIN_COLOURS[view['behaviour']]
+    rgb = rgb * shade[..., None]
+    rgb = rgb + (1 - rgb) * 0.5 * real_share[..., None]
+
+    fig = Figure(figsize=(8, 8))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    ax.imshow(rgb, extent=region, origin='upper', interpolation='nearest')
+    ax.set_xlabel("Re z₀")
+    ax.set_ylabel("Im z₀")
+    ax.set_title(title)
+    fig.savefig(path, dpi=120, bbox_inches='tight')
+    return path
@@ -0,0 +1,78 @@
+from itertools import islice
+from mpmath import mp, mpf, sin, exp
+
+from lz_maps import KAPPA_SEED, MAPS, get_recursion
+
+"""
+LOGOS THEORY - STREAMING LZ SEQUENCE
+Author: Martin Doina
+
+Lazily yields LZ_0, LZ_1, ... one level at a time. Only the current level
+is held in memory, so the depth is unbounded.
+"""
+
+
+def column_step(recursion):
+    """The step as g(sin ψ, exp(-ψ)) if the recursion's family declares one, else None"""
+    bound = MAPS.get(recursion)
+    return bound.column_step() if bound is not None else None
+
+
+def iter_lz(seed=KAPPA_SEED, dps=100, recursion='logos', with_hqs=False):
+    """Yield LZ_n (or (LZ_n, HQS_n) pairs) forever at the given precision"""
+    if with_hqs and column_step(recursion) is not None:
+        for value, _, _, hqs in iter_lz_columns(seed, dps, recursion):
+            yield value, hqs
+        return
+    step = get_recursion(recursion)
+    with mp.workdps(dps):
+        value = mpf(seed)
+    while True:
+        if with_hqs:
+            with mp.workdps(dps):
+                hqs = exp(-value) / value
+            yield value, hqs
+        else:
+            yield value
+        # Precision is only raised around the step itself, never across a
+        # yield, so consumers keep their own mp.dps while iterating
+        with mp.workdps(dps):
+            value = step(value)
+
+
+def take_lz(count, seed=KAPPA_SEED, dps=100, recursion='logos', with_hqs=False):
+    """First `count` items of iter_lz as a list"""
+    return list(islice(iter_lz(seed, dps, recursion, with_hqs), count))
+
+
+def iter_lz_columns(seed=KAPPA_SEED, dps=100, recursion='logos'):
+    """Yield (LZ_n, sin LZ_n, exp(-LZ_n), HQS_n) with one sin and one exp per level
+
+    exp(-ψ) feeds both HQS_n = exp(-ψ_n)/ψ_n and the 'logos' step
+    ψ_{n+1} = sin ψ_n + exp(-ψ_n); the levels are bit-identical to iter_lz.
+    The step comes from the family's columns hook, so this works for any
+    registered recursion whose family gives one for its parameters.
+    """
+    step = column_step(recursion)
+    if step is None:
+        get_recursion(recursion)
+        raise ValueError(f"Recursion '{recursion}' has no step in sin(ψ) and exp(-ψ)")
+    with mp.workdps(dps):
+        value = mpf(seed)
+    while True:
+        with mp.workdps(dps):
+            s = sin(value)
+            e = exp(-value)
+            hqs = e / value
+        yield value, s, e, hqs
+        with mp.workdps(dps):
+            value = step(s, e)
+
+
+def lz_hqs_table(depth, seed=KAPPA_SEED, dps=100, recursion='logos'):
+    """Column-wise {'lz', 'sin', 'exp', 'hqs'} lists for LZ_0 .. LZ_{depth-1}"""
+    table = {'lz': [], 'sin': [], 'exp': [], 'hqs': []}
+    for row in islice(iter_lz_columns(seed, dps, recursion), depth):
+        for column, value in zip(('lz', 'sin', 'exp', 'hqs'), row):
+            table[column].append(value)
+    return table
@@ -0,0 +1,246 @@
+import os
+import json
+import hashlib
+import tempfile
+from itertools import islice
+from mpmath import mp, mpf, mpc
+
+from lz_maps import KAPPA_SEED, asin_step
+from lz_sequence import iter_lz
+from lz_jump import fit_tail, jump_level, jump_levels
+
+"""
+LOGOS THEORY - SHARED LZ LEVEL STORE
+Author: Martin Doina
+
+Computes LZ levels for a (recursion, seed, dps) once and keeps them in a
+versioned on-disk cache, so catalog scripts stop re-typing float literals.
+The complex upward levels LZ-1, LZ-2, ... (iterated asin) live here too.
+"""
+
+# Bump when the cache file layout changes; old files are simply ignored.
+# 2: negative levels stored with their sign (version 1 files may have lost it)
+# 3: upward chains of seeds beyond ±1 start on asin_step's side of the cut
+CACHE_VERSION = 3
+
+CACHE_DIR = os.environ.get(
+    'LOGOS_LZ_CACHE',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '.lz_cache'),
+)
+
+
+def compute_levels(depth, seed=KAPPA_SEED, dps=100, recursion='logos', start=None):
+    """Compute LZ_0 .. LZ_{depth-1} at the given precision (no cache)"""
+    levels = list(start) if start else []
+    if len(levels) >= depth:
+        return levels[:depth]
+    if levels:
+        # Resume from the last known level; it is re-yielded first, so skip it
+        stream = islice(iter_lz(levels[-1], dps, recursion), 1, None)
+    else:
+        stream = iter_lz(seed, dps, recursion)
+    levels.extend(islice(stream, depth - len(levels)))
+    return levels
+
+
+def _cache_path(seed, dps, recursion, suffix='json'):
+    key = f"{CACHE_VERSION}|{recursion}|{seed}|{dps}"
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+    return os.path.join(CACHE_DIR, f"{recursion}-{dps}-{digest}.{suffix}")
+
+
+def _read_cache(path, seed, dps, recursion):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return []
+    if (data.get('version') != CACHE_VERSION or data.get('seed') != seed
+            or data.get('dps') != dps or data.get('recursion') != recursion):
+        return []
+    with mp.workdps(dps):
+        # Exact binary mantissa/exponent pairs - no decimal re-rounding
+        return [mpf((man, exp)) for man, exp in data['levels']]
+
+
+def _signed_man_exp(value):
+    # mpf.man_exp drops the sign, so read the raw (sign, man, exp, bc) tuple
+    sign, man, exp, _ = value._mpf_
+    return [-man if sign else man, exp]
+
+
+def _write_json(path, data):
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    # A private temp file per writer: concurrent writers never share it and
+    # the last os.replace wins with a complete file
+    with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=directory,
+                                     suffix='.tmp', delete=False) as f:
+        tmp = f.name
+        try:
+            json.dump(data, f)
+        except BaseException:
+            f.close()
+            os.unlink(tmp)
+            raise
+    # NamedTemporaryFile creates it owner-only, but the cache is shared
+    os.chmod(tmp, 0o644)
+    os.replace(tmp, path)
+
+
+def _write_cache(path, levels, seed, dps, recursion):
+    _write_json(path, {
+        'version': CACHE_VERSION,
+        'recursion': recursion,
+        'seed': seed,
+        'dps': dps,
+        'depth': len(levels),
+        'levels': [_signed_man_exp(v) for v in levels],
+    })
+
+
+def load_levels(depth, seed=KAPPA_SEED, dps=100, recursion='logos', cache=True):
+    """LZ_0 .. LZ_{depth-1} as mpf, served from the on-disk cache when possible"""
+    seed = str(seed)
+    if not cache:
+        return compute_levels(depth, seed, dps, recursion)
+
+    path = _cache_path(seed, dps, recursion)
+    levels = _read_cache(path, seed, dps, recursion)
+    if len(levels) < depth:
+        # Extend the deepest cached table rather than starting over
+        levels = compute_levels(depth, seed, dps, recursion, start=levels)
+        _write_cache(path, levels, seed, dps, recursion)
+    return levels[:depth]
+
+
+def lz_levels(depth=46, seed=KAPPA_SEED, dps=50, recursion='logos', cache=True):
+    """Catalog-style {'LZ0': float, ...} dict"""
+    levels = load_levels(depth, seed, dps, recursion, cache)
+    return {f'LZ{i}': float(val) for i, val in enumerate(levels)}
+
+
+def compute_upward(depth, seed=KAPPA_SEED, dps=50, start=None):
+    """Upward levels LZ-1 .. LZ-depth at the given precision (no cache)
+
+    As in the catalogs, a0 = asin(LZ0) and LZ-i = asin^i(a0), every asin
+    taken with asin_step's branch convention (a0 included). The chain
+    creeps towards the parabolic fixed point 0 like sqrt(3/i), so it
+    never settles to working precision and always runs to `depth`.
+    """
+    levels = list(start) if start else []
+    with mp.workdps(dps):
+        current = levels[-1] if levels else asin_step(mpf(seed))
+        while len(levels) < depth:
+            current = asin_step(current)
+            levels.append(mpc(current))
+    return levels[:depth]
+
+
+def _read_upward(path, seed, dps):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return []
+    if (data.get('version') != CACHE_VERSION or data.get('seed') != seed
+            or data.get('dps') != dps or data.get('recursion') != 'asin'):
+        return []
+    with mp.workdps(dps):
+        return [mpc(mpf(tuple(re)), mpf(tuple(im))) for re, im in data['levels']]
+
+
+def load_upward(depth, seed=KAPPA_SEED, dps=50, cache=True):
+    """LZ-1 .. LZ-depth as mpc, served from the on-disk cache when possible"""
+    seed = str(seed)
+    if not cache:
+        return compute_upward(depth, seed, dps)
+
+    path = _cache_path(seed, dps, 'asin')
+    levels = _read_upward(path, seed, dps)
+    if len(levels) < depth:
+        levels = compute_upward(depth, seed, dps, start=levels)
+        _write_json(path, {
+            'version': CACHE_VERSION,
+            'recursion': 'asin',
+            'seed': seed,
+            'dps': dps,
+            'depth': len(levels),
+            'levels': [[_signed_man_exp(v.real), _signed_man_exp(v.imag)] for v in levels],
+        })
+    return levels[:depth]
+
+
+def upward_levels(depth=19, seed=KAPPA_SEED, dps=50, cache=True):
+    """Catalog-style {'LZ-1': complex, ...} dict (float view)"""
+    levels = load_upward(depth, seed, dps, cache)
+    return {f'LZ-{i}': complex(val) for i, val in enumerate(levels, 1)}
+
+
+# In-process memo of jump-ahead fits, backed by '.jump.json' cache files
+_FITS = {}
+
+# Tail-fit fields holding mpf values (single or lists), stored as [man, exp]
+_FIT_MPF = ('attractor', 'fatou_constant', 'checkpoint_level')
+
+
+def _exact_mpf(man, exp):
+    # Fits carry more digits than dps (guard / shifted precision); keep them all
+    with mp.workprec(max(abs(man).bit_length(), 1)):
+        return mpf((man, exp))
+
+
+def _read_fit(path, seed, dps, recursion):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if (data.get('version') != CACHE_VERSION or data.get('seed') != seed
+            or data.get('dps') != dps or data.get('recursion') != recursion):
+        return None
+    fit = data['fit']
+    for key in _FIT_MPF:
+        if key in fit:
+            fit[key] = _exact_mpf(*fit[key])
+    if 'levels' in fit:
+        fit['levels'] = [_exact_mpf(man, exp) for man, exp in fit['levels']]
+    return fit
+
+
+def load_fit(seed=KAPPA_SEED, dps=100, recursion='logos', cache=True):
+    """Jump-ahead tail fit (see lz_jump.fit_tail), computed once per key"""
+    seed = str(seed)
+    key = (recursion, seed, dps)
+    if key in _FITS:
+        return _FITS[key]
+    path = _cache_path(seed, dps, recursion, 'jump.json')
+    fit = _read_fit(path, seed, dps, recursion) if cache else None
+    if fit is None:
+        fit = fit_tail(seed, dps, recursion)
+        if cache:
+            stored = dict(fit)
+            for name in _FIT_MPF:
+                if name in stored:
+                    stored[name] = _signed_man_exp(stored[name])
+            if 'levels' in stored:
+                stored['levels'] = [_signed_man_exp(v) for v in stored['levels']]
+            _write_json(path, {'version': CACHE_VERSION, 'recursion': recursion,
+                               'seed': seed, 'dps': dps, 'fit': stored})
+    _FITS[key] = fit
+    return fit
+
+
+def level(n, seed=KAPPA_SEED, dps=100, recursion='logos', cache=True):
+    """LZ_n as mpf for any n: cached table when it reaches n, jump-ahead beyond"""
+    seed = str(seed)
+    if cache:
+        levels = _read_cache(_cache_path(seed, dps, recursion), seed, dps, recursion)
+        if n < len(levels):
+            return levels[n]
+    return jump_level(load_fit(seed, dps, recursion, cache), n)
+
+
+def level_range(n0, n1, seed=KAPPA_SEED, dps=100, recursion='logos', step=1, cache=True):
+    """LZ_n for n in range(n0, n1, step), jumping straight to n0"""
+    return list(jump_levels(load_fit(seed, dps, recursion, cache), n0, n1, step))
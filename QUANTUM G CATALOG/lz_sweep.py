@@ -0,0 +1,128 @@
+import numpy as np
+
+from lz_maps import get_float_recursion
+
+"""
+LOGOS THEORY - VECTORIZED MULTI-SEED LZ SWEEP
+Author: Martin Doina
+
+Advances the LZ recursion in float64 for a whole array of seeds at once.
+Seeds are processed in chunks so working memory stays bounded; the full
+(seeds × depth) result can be written straight into a .npy memmap.
+The complex upward chain z ← asin(z) gets the same treatment in complex128.
+"""
+
+DEFAULT_CHUNK = 1 << 16
+
+
+def sweep(seeds, depth, recursion='logos', chunk_size=DEFAULT_CHUNK, out=None):
+    """Return a (len(seeds), depth) array with LZ_0 .. LZ_{depth-1} per seed"""
+    step = get_float_recursion(recursion)
+    seeds = np.asarray(seeds, dtype=np.float64).ravel()
+    if depth < 0:
+        raise ValueError(f"depth must be >= 0, got {depth}")
+    if out is None:
+        out = np.empty((seeds.size, depth), dtype=np.float64)
+    elif out.shape != (seeds.size, depth):
+        raise ValueError(f"out has shape {out.shape}, expected {(seeds.size, depth)}")
+    if depth == 0 or seeds.size == 0:
+        return out
+
+    # Level-major scratch block: each level is a contiguous row
+    block = np.empty((depth, min(chunk_size, seeds.size)), dtype=np.float64)
+    for lo in range(0, seeds.size, chunk_size):
+        hi = min(lo + chunk_size, seeds.size)
+        work = block[:, :hi - lo]
+        work[0] = seeds[lo:hi]
+        for level in range(1, depth):
+            step(work[level - 1], work[level])
+        out[lo:hi] = work.T
+    return out
+
+
+def sweep_to_file(path, seeds, depth, recursion='logos', chunk_size=DEFAULT_CHUNK):
+    """Same as sweep() but backed by a .npy memmap for sweeps larger than RAM"""
+    seeds = np.asarray(seeds, dtype=np.float64).ravel()
+    out = np.lib.format.open_memmap(path, mode='w+', dtype=np.float64, shape=(seeds.size, depth))
+    sweep(seeds, depth, recursion, chunk_size, out)
+    out.flush()
+    return out
+
+
+def upward_start(seeds):
+    """a0 = asin(seed) as the catalogs take it, as complex128
+
+    Seeds inside [-1, 1] use the real asin (as math.asin does); seeds
+    beyond start on the upper side of the cut, like cmath.asin(x + 0j).
+    """
+    seeds = np.asarray(seeds)
+    if np.iscomplexobj(seeds):
+        return np.arcsin(seeds.astype(np.complex128))
+    seeds = seeds.astype(np.float64)
+    inside = np.abs(seeds) <= 1
+    a0 = np.arcsin(seeds.astype(np.complex128))
+    a0[inside] = np.arcsin(seeds[inside])
+    return a0
+
+
+def sweep_upward(seeds, depth, chunk_size=DEFAULT_CHUNK, out=None, from_seed=True):
+    """Return a (len(seeds), depth) complex128 array with LZ-1 .. LZ-depth per seed
+
+    With from_seed the points are LZ0 values and the chain starts from
+    a0 = asin(LZ0) as in the catalogs; otherwise the points are a0 itself.
+    """
+    seeds = np.asarray(seeds).ravel()
+    if out is None:
+        out = np.empty((seeds.size, depth), dtype=np.complex128)
+    elif out.shape != (seeds.size, depth):
+        raise ValueError(f"out has shape {out.shape}, expected {(seeds.size, depth)}")
+
+    block = np.empty((depth + 1, min(chunk_size, seeds.size)), dtype=np.complex128)
+    for lo in range(0, seeds.size, chunk_size):
+        hi = min(lo + chunk_size, seeds.size)
+        work = block[:, :hi - lo]
+        work[0] = upward_start(seeds[lo:hi]) if from_seed else seeds[lo:hi]
+        for level in range(1, depth + 1):
+            # -0.0 + 0.0 = +0.0: real points sit on the upper side of the
+            # cut, the cmath / lz_store.asin_step branch convention
+            work[level - 1].imag += 0.0
+            np.arcsin(work[level - 1], out=work[level])
+        out[lo:hi] = work[1:].T
+    return out
+
+
+def sweep_upward_to_file(path, seeds, depth, chunk_size=DEFAULT_CHUNK, from_seed=True):
+    """Same as sweep_upward() but backed by a .npy memmap"""
+    seeds = np.asarray(seeds).ravel()
+    out = np.lib.format.open_memmap(path, mode='w+', dtype=np.complex128, shape=(seeds.size, depth))
+    sweep_upward(seeds, depth, chunk_size, out, from_seed)
+    out.flush()
+    return out
+
+
+def sweep_family(family, seeds, depth, chunk_size=DEFAULT_CHUNK, **params):
+    """Sweep a RecursionFamily over parameter arrays -> (params, seeds, depth)
+
+    Parameters are broadcast against each other (pass a flattened meshgrid
+    for a full (a, b, c) grid); unspecified ones keep the family defaults.
+    """
+    seeds = np.asarray(seeds, dtype=np.float64).ravel()
+    grid = np.broadcast_arrays(*[np.asarray(v, dtype=np.float64).ravel() for v in params.values()])
+    count = grid[0].size if grid else 1
+    columns = {name: column[:, None] for name, column in zip(params, grid)}
+
+    if depth < 0:
+        raise ValueError(f"depth must be >= 0, got {depth}")
+    out = np.empty((count, seeds.size, depth), dtype=np.float64)
+    if depth == 0:
+        return out
+    # chunk_size bounds (parameter, seed) pairs per block
+    step = max(1, chunk_size // count)
+    for lo in range(0, seeds.size, step):
+        hi = min(lo + step, seeds.size)
+        x = np.repeat(seeds[None, lo:hi], count, axis=0)
+        out[:, lo:hi, 0] = x
+        for level in range(1, depth):
+            x = family.evaluate(x, np, **columns)
+            out[:, lo:hi, level] = x
+    return out
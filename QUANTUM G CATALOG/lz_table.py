@@ -0,0 +1,134 @@
+import json
+import struct
+from itertools import islice
+
+import numpy as np
+from mpmath import mp, mpf
+
+from lz_maps import KAPPA_SEED
+from lz_sequence import iter_lz
+
+"""
+LOGOS THEORY - BINARY LZ LEVEL TABLES
+Author: Martin Doina
+
+Compact, memory-mappable storage for high-precision LZ levels. Each level
+is a fixed-size row (binary exponent, sign, mantissa bytes), so a reader
+maps the file and decodes only the rows it touches instead of parsing
+hundreds of megabytes of decimal text.
+
+Layout (little-endian):
+  magic 'LZTB' | version u16 | reserved u16 | depth u64 | meta length u32
+  JSON metadata (seed, dps, prec, recursion, mantissa bytes), padded to 8
+  depth rows of {exp i8, sign u1, man [mantissa bytes]}
+"""
+
+MAGIC = b'LZTB'
+TABLE_VERSION = 1
+_FIXED = struct.Struct('<4sHHQI')
+_BATCH = 4096
+
+
+def _row_dtype(man_bytes):
+    return np.dtype([('exp', '<i8'), ('sign', 'u1'), ('man', f'V{man_bytes}')])
+
+
+def _encode(rows, i, value, man_bytes, prec):
+    # Round to the table precision first: a value carrying more bits (or a
+    # float / string) must still fit the fixed mantissa field
+    with mp.workprec(prec):
+        value = mpf(value)
+    # mpf.man_exp drops the sign, so read the raw (sign, man, exp, bc) tuple
+    sign, man, exp, _ = value._mpf_
+    rows[i]['exp'] = exp
+    rows[i]['sign'] = sign
+    rows[i]['man'] = man.to_bytes(man_bytes, 'little')
+
+
+def write_table(path, levels, depth, seed=KAPPA_SEED, dps=100, recursion='logos'):
+    """Stream up to `depth` levels from any iterable into a table file
+
+    Levels are rounded to the table precision (dps) as they are written.
+    """
+    with mp.workdps(dps):
+        prec = mp.prec
+    man_bytes = (prec + 7) // 8
+    meta = json.dumps({
+        'seed': str(seed),
+        'dps': dps,
+        'prec': prec,
+        'recursion': recursion,
+        'man_bytes': man_bytes,
+    }).encode('utf-8')
+    meta += b' ' * (-(_FIXED.size + len(meta)) % 8)
+
+    dtype = _row_dtype(man_bytes)
+    written = 0
+    with open(path, 'wb') as f:
+        f.write(_FIXED.pack(MAGIC, TABLE_VERSION, 0, 0, len(meta)))
+        f.write(meta)
+        levels = islice(levels, depth)
+        while True:
+            batch = list(islice(levels, _BATCH))
+            if not batch:
+                break
+            rows = np.zeros(len(batch), dtype=dtype)
+            for i, value in enumerate(batch):
+                _encode(rows, i, value, man_bytes, prec)
+            f.write(rows.tobytes())
+            written += len(batch)
+        # Depth is patched in last so the writer can consume a generator
+        f.seek(0)
+        f.write(_FIXED.pack(MAGIC, TABLE_VERSION, 0, written, len(meta)))
+    return written
+
+
+def build_table(path, depth, seed=KAPPA_SEED, dps=100, recursion='logos'):
+    """Compute LZ_0 .. LZ_{depth-1} and write them straight to a table file"""
+    return write_table(path, iter_lz(seed, dps, recursion), depth, seed, dps, recursion)
+
+
+class LZTable:
+    """Read-only, memory-mapped view of a binary LZ table"""
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            magic, version, _, depth, meta_len = _FIXED.unpack(f.read(_FIXED.size))
+            if magic != MAGIC:
+                raise ValueError(f"{path}: not an LZ table")
+            if version != TABLE_VERSION:
+                raise ValueError(f"{path}: unsupported table version {version}")
+            self.meta = json.loads(f.read(meta_len).decode('utf-8'))
+        self.seed = self.meta['seed']
+        self.dps = self.meta['dps']
+        self.prec = self.meta['prec']
+        self.recursion = self.meta['recursion']
+        self.depth = depth
+        self._rows = np.memmap(path, dtype=_row_dtype(self.meta['man_bytes']), mode='r',
+                               offset=_FIXED.size + meta_len, shape=(depth,))
+
+    def __len__(self):
+        return self.depth
+
+    def _decode(self, row):
+        man = int.from_bytes(row['man'].tobytes(), 'little')
+        if row['sign']:
+            man = -man
+        with mp.workprec(self.prec):
+            return mpf((man, int(row['exp'])))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._decode(row) for row in self._rows[index]]
+        return self._decode(self._rows[index])
+
+    def __iter__(self):
+        for row in self._rows:
+            yield self._decode(row)
+
+    def floats(self, start=0, stop=None):
+        """Rows [start, stop) as a float64 array"""
+        return np.array([float(v) for v in self[start:stop]], dtype=np.float64)
+
+    def close(self):
+        self._rows._mmap.close()
@@ -0,0 +1,330 @@
+import ast
+import math
+import inspect
+from functools import lru_cache
+
+import numpy as np
+from mpmath import mp, mpf
+
+from lz_maps import compile_expression
+
+"""
+LOGOS THEORY - TRANSFORMATION COMPILER
+Author: Martin Doina
+
+The catalogs declare their transformations as dicts of lambdas,
+
+  'LZ × φ⁸': lambda x: x * float(phi**8),
+  'LZ/φ²':   lambda x: x / (phi**2),
+  '1/φ':     1/phi,
+
+and call them once per (level, target) pair, so every call redoes the
+mpmath power and the float conversion. compile_transformations reads each
+lambda's expression back from the catalog source and turns it into a
+NumPy kernel over a whole feature column:
+
+  - every subexpression that does not involve x (phi**8, 1/phi, pi/phi)
+    is evaluated once, at the requested precision, and bound as a float;
+  - entries without x at all (plain constants, lambda x: 2/phi) become a
+    single value, evaluated once per run instead of once per level;
+  - sin/cos/exp/log/sqrt/abs of mpmath, math or builtins map to NumPy,
+    float() becomes a no-op and `a if cond else b` becomes np.where.
+
+Lambdas the compiler cannot read stay callables and are applied element
+by element. Either way a failed evaluation (an exception in the
+catalogs' try/except loops, here a NaN or inf) comes back as NaN.
+
+Hand-enumerated scalings ('LZ×φ¹⁰', 'LZ×π⁵', 'LZ×φ¹⁰×π⁵', ...) can be
+declared as a ScalingFamily instead: LZ × Π base^e over integer exponent
+ranges. The family lives in log space as the outer sum of e·log(base)
+over the ranges, so tens of thousands of scalings are one sorted float64
+array and the best scaling per level is a binary search, not a closure.
+"""
+
+_NUMPY_FUNCTIONS = {
+    'sin': np.sin, 'cos': np.cos, 'tan': np.tan, 'asin': np.arcsin, 'acos': np.arccos,
+    'atan': np.arctan, 'exp': np.exp, 'log': np.log, 'log10': np.log10, 'sqrt': np.sqrt,
+    'fabs': np.abs, 'abs': np.abs, 'sinh': np.sinh, 'cosh': np.cosh, 'tanh': np.tanh,
+}
+
+# float() and mpf() of a float64 column are the column itself
+_IDENTITY = {'float', 'mpf'}
+
+
+@lru_cache(maxsize=None)
+def _source_lambdas(path):
+    """Lambda nodes of a source file keyed by (line, column)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read(), path)
+    return {(node.lineno, node.col_offset): node for node in ast.walk(tree) if isinstance(node, ast.Lambda)}
+
+
+def _lambda_node(func):
+    """The ast.Lambda of a one-argument lambda, or None if it cannot be found"""
+    code = getattr(func, '__code__', None)
+    if code is None or func.__name__ != '<lambda>' or code.co_argcount != 1:
+        return None
+    try:
+        path = inspect.getsourcefile(func)
+        nodes = _source_lambdas(path)
+    except (TypeError, OSError, SyntaxError):
+        return None
+    matches = [node for (line, _), node in nodes.items() if line == code.co_firstlineno]
+    if len(matches) > 1 and hasattr(code, 'co_positions'):
+        # Several lambdas on one line: keep the one whose span holds the code
+        spans = [(c, e) for l, _, c, e in code.co_positions() if l == code.co_firstlineno and c is not None and e > c]
+        if spans:
+            lo, hi = min(c for c, _ in spans), max(e for _, e in spans)
+            matches = [node for node in matches if node.end_lineno == node.lineno
+                       and node.col_offset <= lo and hi <= node.end_col_offset]
+    return matches[0] if len(matches) == 1 else None
+
+
+def _uses(node, name):
+    return any(isinstance(n, ast.Name) and n.id == name for n in ast.walk(node))
+
+
+def _numpy_function(value):
+    """NumPy replacement for a math / mpmath / builtin callable, or None"""
+    name = getattr(value, '__name__', None)
+    module = getattr(value, '__module__', None) or ''
+    if name in _IDENTITY and (value is float or module.startswith('mpmath')):
+        return 'identity'
+    if name in _NUMPY_FUNCTIONS and (value is abs or value is getattr(math, name, None)
+                                     or module.startswith('mpmath')):
+        return name
+    return None
+
+
+class _Compiler(ast.NodeTransformer):
+    """Rewrite a lambda body into a NumPy expression with hoisted constants"""
+
+    def __init__(self, arg, scope, constants, dps, origin):
+        self.arg = arg
+        self.scope = scope
+        self.constants = constants
+        self.dps = dps
+        self.origin = origin
+
+    def _constant(self, node):
+        # Shared between lambdas of the same module, e.g. every phi**2
+        key = (self.origin, ast.dump(node))
+        if key not in self.constants:
+            with mp.workdps(self.dps):
+                value = eval(compile(ast.Expression(node), '<constant>', 'eval'), self.scope)
+            self.constants[key] = (f'_c{len(self.constants)}', float(value))
+        return ast.Name(self.constants[key][0], ast.Load())
+
+    def visit(self, node):
+        if isinstance(node, ast.expr) and not isinstance(node, ast.Constant) and not _uses(node, self.arg):
+            return self._constant(node)
+        return super().visit(node)
+
+    def visit_Call(self, node):
+        if node.keywords or len(node.args) != 1:
+            raise ValueError("unsupported call")
+        with mp.workdps(self.dps):
+            target = eval(compile(ast.Expression(node.func), '<callee>', 'eval'), self.scope)
+        name = _numpy_function(target)
+        if name is None:
+            raise ValueError(f"unsupported function {ast.unparse(node.func)}")
+        argument = self.visit(node.args[0])
+        if name == 'identity':
+            return argument
+        return ast.Call(ast.Name(f'_np_{name}', ast.Load()), [argument], [])
+
+    def visit_IfExp(self, node):
+        return ast.Call(ast.Name('_np_where', ast.Load()),
+                        [self.visit(node.test), self.visit(node.body), self.visit(node.orelse)], [])
+
+    def visit_Compare(self, node):
+        if len(node.ops) != 1:
+            raise ValueError("chained comparison")
+        return self.generic_visit(node)
+
+    def generic_visit(self, node):
+        if not isinstance(node, (ast.BinOp, ast.UnaryOp, ast.Compare, ast.Name, ast.Constant,
+                                 ast.operator, ast.unaryop, ast.cmpop, ast.expr_context)):
+            raise ValueError(f"unsupported syntax {type(node).__name__}")
+        return super().generic_visit(node)
+
+
+class Transformation:
+    """One compiled catalog entry: a constant, a NumPy kernel, or an element-wise fallback"""
+
+    def __init__(self, name, source, value=None, kernel=None, func=None, expression=None):
+        self.name = name
+        self.source = source
+        self.value = value
+        self.expression = expression
+        self._kernel = kernel
+        self._func = func
+
+    @property
+    def constant(self):
+        return self.value is not None
+
+    @property
+    def vectorized(self):
+        return self._func is None
+
+    def __repr__(self):
+        body = self.value if self.constant else self.expression or 'element-wise'
+        return f"Transformation({self.name!r}: {body})"
+
+    def __call__(self, x):
+        """Values over a float64 column x; NaN where the catalog lambda would fail"""
+        x = np.asarray(x, dtype=np.float64)
+        if self.constant:
+            out = np.full(x.shape, self.value)
+        elif self._kernel is not None:
+            with np.errstate(all='ignore'):
+                out = np.array(np.broadcast_to(self._kernel(x), x.shape), dtype=np.float64)
+        else:
+            out = np.full(x.shape, np.nan)
+            for i, v in np.ndenumerate(x):
+                try:
+                    out[i] = float(self._func(float(v)))
+                except Exception:
+                    continue
+        out[~np.isfinite(out)] = np.nan
+        return out
+
+
+def _compile_one(name, func, constants, dps):
+    if not callable(func):
+        try:
+            with mp.workdps(dps):
+                return Transformation(name, func, value=float(func))
+        except (TypeError, ValueError):
+            # Complex constants, strings ...: evaluated per element like the
+            # catalog loops, which come back NaN wherever float() fails
+            return Transformation(name, func, func=lambda x: func)
+    node = _lambda_node(func)
+    if node is None:
+        return Transformation(name, func, func=func)
+    arg = node.args.args[0].arg
+    scope = dict(func.__globals__)
+    origin = id(func.__globals__)
+    if func.__closure__:
+        scope.update(zip(func.__code__.co_freevars, (c.cell_contents for c in func.__closure__)))
+        origin = id(func)
+    try:
+        if not _uses(node.body, arg):
+            # Constant-only lambda: evaluated once for the whole run
+            with mp.workdps(dps):
+                return Transformation(name, func, value=float(eval(compile(
+                    ast.Expression(node.body), '<constant>', 'eval'), scope)))
+        body = _Compiler(arg, scope, constants, dps, origin).visit(node.body)
+    except Exception:
+        return Transformation(name, func, func=func)
+    expression = ast.unparse(body)
+    namespace = {f'_np_{k}': v for k, v in _NUMPY_FUNCTIONS.items()}
+    namespace['_np_where'] = np.where
+    namespace.update({label: value for label, value in constants.values()})
+    kernel = compile_expression(body, (arg,), namespace, f'transformation {name}')
+    return Transformation(name, func, kernel=kernel, expression=expression)
+
+
+def compile_transformations(transformations, dps=None):
+    """{name: lambda or constant} -> {name: Transformation}, constants fixed at dps"""
+    dps = dps or mp.dps
+    constants = {}
+    return {name: _compile_one(name, func, constants, dps) for name, func in transformations.items()}
+
+
+def evaluate_table(compiled, x):
+    """(len(x), len(compiled)) float64 table of every transformation over x"""
+    x = np.asarray(x, dtype=np.float64).ravel()
+    table = np.empty((x.size, len(compiled)), dtype=np.float64)
+    for t, transformation in enumerate(compiled.values()):
+        table[:, t] = transformation(x)
+    return table
+
+
+# Feature / class code returned by the best() searches when nothing is usable
+NO_MATCH = -1
+
+_SUPERSCRIPTS = str.maketrans('0123456789-', '⁰¹²³⁴⁵⁶⁷⁸⁹⁻')
+
+
+class ScalingFamily:
+    """LZ × Π base^e over integer exponent ranges, searched in log space
+
+    bases is {symbol: (value, exponents)}, e.g.
+    {'φ': (phi, range(-20, 21)), 'π': (pi, range(-10, 11)), '10': (10, range(-5, 6))};
+    values may be mpf, mpmath constants or decimal strings and are taken at dps.
+    """
+
+    def __init__(self, bases, dps=None, separator='×'):
+        self.symbols = tuple(bases)
+        self.separator = separator
+        self.dps = dps or mp.dps
+        with mp.workdps(self.dps):
+            self._bases = [mpf(value) for value, _ in bases.values()]
+            logs = [float(mp.log(b)) for b in self._bases]
+        self.exponents = tuple(np.asarray(list(e), dtype=np.int64) for _, e in bases.values())
+        self.shape = tuple(e.size for e in self.exponents)
+
+        # Outer sum of e·log(base): flat index i <-> np.unravel_index(i, shape)
+        log_scales = np.zeros(())
+        for e, log_base in zip(self.exponents, logs):
+            log_scales = np.add.outer(log_scales, e * log_base)
+        self.log_scales = log_scales.ravel()
+        self._order = np.argsort(self.log_scales, kind='stable')
+        self._sorted = np.exp(self.log_scales[self._order])
+
+    def __len__(self):
+        return self.log_scales.size
+
+    def __repr__(self):
+        ranges = ', '.join(f'{s}^[{e.min()}..{e.max()}]' if e.size else f'{s}^[]'
+                           for s, e in zip(self.symbols, self.exponents))
+        return f"ScalingFamily(LZ × {ranges}: {len(self):,} scalings)"
+
+    def powers(self, index):
+        """Exponent per base symbol of scaling `index`"""
+        position = np.unravel_index(index, self.shape)
+        return {s: int(e[p]) for s, e, p in zip(self.symbols, self.exponents, position)}
+
+    def name(self, index, feature='LZ'):
+        """Catalog-style name, e.g. 'LZ×φ¹⁰×π⁵' (zero exponents left out)"""
+        parts = [feature] + [symbol + (str(e).translate(_SUPERSCRIPTS) if e != 1 else '')
+                             for symbol, e in self.powers(index).items() if e != 0]
+        return self.separator.join(parts)
+
+    def value(self, x, index):
+        """x × scaling `index`, evaluated at the family precision"""
+        with mp.workdps(self.dps):
+            result = mpf(float(x))
+            for base, e in zip(self._bases, self.powers(index).values()):
+                if e:
+                    result *= base ** e
+            return float(result)
+
+    def log_table(self, values):
+        """(len(values), len(self)) outer sum log|x| + log(scaling)"""
+        with np.errstate(divide='ignore'):
+            return np.add.outer(np.log(np.abs(np.asarray(values, dtype=np.float64).ravel())), self.log_scales)
+
+    def best(self, values, target, accept=None):
+        """Closest x × scaling to target over a feature array -> (feature, index, value, error)
+
+        For each feature only the two scalings around target/x can be
+        nearest, found by binary search; accept masks usable features.
+        Returns (NO_MATCH, NO_MATCH, nan, inf) when nothing is usable.
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pos = np.searchsorted(self._sorted, target / values)
+        n = self._sorted.size
+        candidates = np.stack([np.clip(pos - 1, 0, n - 1), np.clip(pos, 0, n - 1)])
+        error = np.abs(values * self._sorted[candidates] - target)
+        usable = np.isfinite(values) if accept is None else np.isfinite(values) & accept
+        error[:, ~usable] = np.nan
+        if np.all(np.isnan(error)):
+            return NO_MATCH, NO_MATCH, float('nan'), float('inf')
+        side, feature = np.unravel_index(np.nanargmin(error), error.shape)
+        index = int(self._order[candidates[side, feature]])
+        value = self.value(values[feature], index)
+        return int(feature), index, value, abs(value - target)
@@ -0,0 +1,332 @@
+import re
+
+import numpy as np
+
+from lz_maps import compile_expression
+from lz_transform import NO_MATCH, compile_transformations, evaluate_table
+
+"""
+LOGOS THEORY - COLUMNAR QUANTUM ZOO
+Author: Martin Doina
+
+The catalogs build their "quantum zoo" as a dict of strings like
+'LZ-7_imag_p3' -> float and then loop over it in Python. Here the zoo is
+a float64 matrix, levels × feature kinds, and a feature is addressed by
+two integer codes:
+
+  row    index into level_names   ('LZ0', 'LZ1', ..., then 'LZ-1', 'LZ-2', ...)
+  kind   index into kinds         ('', '_real', '_imag', ...)
+
+Feature kinds are declared once, as expressions in the level parts
+
+  x        value of a real ladder level
+  z        complex upward level
+  re, im   |Re z|, |Im z| (the catalogs keep positive signs only)
+
+plus an optional `where` guard; rows where a kind does not apply are NaN.
+Columns are materialized lazily: a kind is evaluated the first time a
+search asks for it and cached from then on, so a wide spec (every
+_real/_imag/_mag power) costs nothing until it is used. Names are put
+together only for the matches that get printed.
+
+Many candidates are the same number under different names ('LZ/φ' and
+'LZ × (1/φ)', a constant transformation on every level). CandidateTable
+collapses values that agree to working precision into one class before
+the search and keeps every formula of the class for the report.
+"""
+
+_UPWARD_ARGS = ('z', 're', 'im')
+_NUMPY_NAMES = {'sqrt': np.sqrt, 'where': np.where, 'abs': np.abs, 'exp': np.exp, 'log': np.log}
+
+
+class FeatureKind:
+    """One derived feature: a name suffix and expressions for ladder / upward rows"""
+
+    def __init__(self, suffix, upward=None, ladder=None, where=None):
+        self.suffix = suffix
+        self.upward = upward
+        self.ladder = ladder
+        self.where = where
+        self._upward = compile_expression(upward, _UPWARD_ARGS, _NUMPY_NAMES, 'feature') if upward else None
+        self._ladder = compile_expression(ladder, ('x',), _NUMPY_NAMES, 'feature') if ladder else None
+        self._where = compile_expression(where, _UPWARD_ARGS, _NUMPY_NAMES, 'guard') if where else None
+
+    def __repr__(self):
+        parts = [repr(self.suffix)] + [f'{k}={getattr(self, k)!r}' for k in ('upward', 'ladder', 'where')
+                                       if getattr(self, k)]
+        return f"FeatureKind({', '.join(parts)})"
+
+    def evaluate(self, x, z):
+        """Column over ladder values x followed by upward levels z, NaN where undefined"""
+        column = np.full(x.size + z.size, np.nan)
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            if self._ladder is not None and x.size:
+                column[:x.size] = self._ladder(x)
+            if self._upward is not None and z.size:
+                parts = (z, np.abs(z.real), np.abs(z.imag))
+                values = np.broadcast_to(self._upward(*parts), z.shape)
+                if self._where is not None:
+                    values = np.where(self._where(*parts), values, np.nan)
+                column[x.size:] = values
+        return column
+
+
+# The ladder level itself; LEVEL_ABS also lets the upward levels stand in
+# by magnitude (the catalog II zoos store the complex value and search abs)
+LEVEL = FeatureKind('', ladder='x')
+LEVEL_ABS = FeatureKind('', ladder='x', upward='abs(z)')
+
+FEATURE_KINDS = {kind.suffix: kind for kind in (
+    LEVEL,
+    FeatureKind('_real', 're'),
+    FeatureKind('_imag', 'im'),
+    FeatureKind('_sum', 're + im'),
+    FeatureKind('_mag', 'sqrt(re**2 + im**2)'),
+    # A purely real level has no product; it falls back to the real part
+    FeatureKind('_prod', 'where(im != 0, re * im, re)'),
+    FeatureKind('_inv_imag', '1.0 / im', where='im != 0'),
+    FeatureKind('_inv_real', '1.0 / re', where='re != 0'),
+)}
+
+# _real_p{n}, _imag_p{n}, _mag_p{n}: declared on demand for any n
+_POWER = re.compile(r'_(real|imag|mag)_p(\d+)$')
+_POWER_BASES = {'real': 're', 'imag': 'im', 'mag': 'sqrt(re**2 + im**2)'}
+_FEATURE_NAME = re.compile(r'(LZ-?\d+)(.*)$')
+
+
+def feature_kind(suffix):
+    """FeatureKind for a catalog suffix ('_sum', '_mag_p5', ...)"""
+    if isinstance(suffix, FeatureKind):
+        return suffix
+    if suffix in FEATURE_KINDS:
+        return FEATURE_KINDS[suffix]
+    match = _POWER.match(suffix)
+    if match is None:
+        raise KeyError(f"Unknown feature kind '{suffix}'")
+    part, n = match.groups()
+    base = _POWER_BASES[part]
+    expression = f'{base}**{n}' if part != 'mag' else f'({base})**{n}'
+    # A vanishing imaginary part has no meaningful powers
+    kind = FeatureKind(suffix, expression, where='im != 0' if part == 'imag' else None)
+    FEATURE_KINDS[suffix] = kind
+    return kind
+
+
+def powers(parts, exponents):
+    """Suffixes '_{part}_p{n}', e.g. powers(('real', 'imag'), range(2, 5)) -> '_real_p2', '_imag_p2', ..."""
+    parts = (parts,) if isinstance(parts, str) else parts
+    return tuple(f'_{part}_p{n}' for n in exponents for part in parts)
+
+
+# Feature kinds of the codata_imaginary.py zoo (the default for build_zoo)
+KINDS = ('', '_real', '_imag', '_sum', '_mag', '_inv_imag') + powers('imag', (2, 3))
+
+
+class Zoo:
+    """Levels × kinds float64 feature matrix with integer-coded names, built lazily"""
+
+    def __init__(self, ladder=(), upward=(), kinds=KINDS):
+        self._x = np.asarray(list(ladder), dtype=np.float64).ravel()
+        self._z = np.asarray(list(upward), dtype=np.complex128).ravel()
+        self.level_names = (tuple(f'LZ{i}' for i in range(self._x.size))
+                            + tuple(f'LZ-{i}' for i in range(1, self._z.size + 1)))
+        self._specs = tuple(feature_kind(k) for k in kinds)
+        self.kinds = tuple(spec.suffix for spec in self._specs)
+        self._columns = {}
+
+    def __len__(self):
+        # Number of features actually present (materializes every column)
+        return int(np.count_nonzero(~np.isnan(self.matrix)))
+
+    def __repr__(self):
+        return (f"Zoo({len(self.level_names)} levels × {len(self.kinds)} kinds, "
+                f"{len(self._columns)} materialized)")
+
+    def column(self, kind):
+        """Feature column for kind code `kind`, evaluated on first use"""
+        if kind not in self._columns:
+            self._columns[kind] = self._specs[kind].evaluate(self._x, self._z)
+        return self._columns[kind]
+
+    def kind_codes(self, kinds=None):
+        """Integer codes for suffixes or codes (None: every kind)"""
+        if kinds is None:
+            return list(range(len(self.kinds)))
+        return [k if isinstance(k, (int, np.integer)) else self.kinds.index(k) for k in kinds]
+
+    def block(self, kinds=None):
+        """Contiguous (levels × len(kinds)) float64 block of the requested kinds"""
+        codes = self.kind_codes(kinds)
+        out = np.empty((len(self.level_names), len(codes)), dtype=np.float64)
+        for j, code in enumerate(codes):
+            out[:, j] = self.column(code)
+        return out
+
+    @property
+    def matrix(self):
+        return self.block()
+
+    def name(self, row, kind):
+        """Catalog-style feature name, e.g. name(50, 6) -> 'LZ-4_imag_p2'"""
+        return f"{self.level_names[row]}{self.kinds[kind]}"
+
+    def feature(self, name):
+        """Value of one feature by catalog name, e.g. feature('LZ-3_mag') (NaN if absent)"""
+        match = _FEATURE_NAME.match(name)
+        if match is None or match.group(1) not in self.level_names or match.group(2) not in self.kinds:
+            raise KeyError(f"Unknown feature '{name}'")
+        level, suffix = match.groups()
+        return float(self.column(self.kinds.index(suffix))[self.level_names.index(level)])
+
+    def items(self, kinds=None):
+        """(name, value) for every present feature of `kinds` (default all), in catalog order"""
+        codes = self.kind_codes(kinds)
+        block = self.block(codes)
+        for row, j in zip(*np.nonzero(~np.isnan(block))):
+            yield self.name(row, codes[j]), float(block[row, j])
+
+
+def build_zoo(real=(), upward=(), kinds=KINDS):
+    """Zoo from real ladder values (LZ0, LZ1, ...) and upward levels (LZ-1, ...)"""
+    return Zoo(real, upward, kinds)
+
+
+# Candidates that agree to this relative tolerance count as the same value
+# (a few float64 ulps: x/φ and x × (1/φ) differ only in the last bit)
+EQUAL_RTOL = 4 * np.finfo(np.float64).eps
+
+
+def _agree(a, b, rtol):
+    return np.abs(a - b) <= rtol * np.maximum(np.abs(a), np.abs(b))
+
+
+def equivalence_classes(values, rtol=EQUAL_RTOL):
+    """Group values that agree to rtol -> (labels, first)
+
+    labels[i] is the class of values[i] (-1 for NaN); classes are numbered
+    by first appearance and first[c] is the index of class c's first member.
+    Every member agrees with its class representative (the smallest value),
+    so a slowly drifting sequence is not chained into one class.
+    """
+    values = np.asarray(values, dtype=np.float64).ravel()
+    labels = np.full(values.size, -1, dtype=np.intp)
+    present = np.flatnonzero(~np.isnan(values))
+    if present.size == 0:
+        return labels, np.empty(0, dtype=np.intp)
+    order = present[np.argsort(values[present], kind='stable')]
+    ordered = values[order]
+    # Neighbours that disagree always split; only the (rare) runs of
+    # neighbours that agree need checking against their representative
+    split = np.concatenate(([True], ~_agree(ordered[1:], ordered[:-1], rtol)))
+    starts = np.flatnonzero(split)
+    ends = np.append(starts[1:], ordered.size)
+    for start, end in zip(starts[ends - starts > 1], ends[ends - starts > 1]):
+        anchor = ordered[start]
+        for i in range(start + 1, end):
+            if not _agree(ordered[i], anchor, rtol):
+                split[i] = True
+                anchor = ordered[i]
+    runs = np.cumsum(split) - 1
+    # Renumber the sorted runs by their first member in the original order
+    run_first = np.full(runs[-1] + 1, values.size, dtype=np.intp)
+    np.minimum.at(run_first, runs, order)
+    renumber = np.empty_like(run_first)
+    renumber[np.argsort(run_first, kind='stable')] = np.arange(run_first.size)
+    labels[order] = renumber[runs]
+    return labels, np.sort(run_first)
+
+
+def formula(feature, transformation):
+    """Catalog formula text: the transformation name with LZ -> feature name"""
+    return transformation.replace('LZ', feature)
+
+
+class CandidateTable:
+    """Every (feature, transformation) value once, duplicates collapsed
+
+    features is a Zoo, searched over the columns of `kinds` (suffixes or
+    codes, default all) so the other kinds are never evaluated, or a
+    {name: value} dict; transformations a catalog dict of callables and
+    constants, compiled to NumPy kernels (lz_transform) with their
+    constants fixed at dps. Features that agree to working precision are
+    evaluated once; the resulting candidates are grouped again by value,
+    so each class is searched once and still carries every formula that
+    produces it. Feature names are only put together by members().
+    """
+
+    def __init__(self, features, transformations, rtol=EQUAL_RTOL, dps=None, kinds=None):
+        self.transform_names = list(transformations)
+        if isinstance(features, Zoo):
+            codes = features.kind_codes(kinds)
+            block = features.block(codes).ravel()
+            present = np.flatnonzero(~np.isnan(block))
+            feature_values = block[present]
+
+            def feature_name(i):
+                row, j = divmod(int(present[i]), len(codes))
+                return features.name(row, codes[j])
+            self._feature_name = feature_name
+        else:
+            names = list(features)
+            feature_values = np.array([abs(v) if isinstance(v, complex) else float(v)
+                                       for v in features.values()])
+            self._feature_name = names.__getitem__
+        feature_labels, feature_first = equivalence_classes(feature_values, rtol)
+
+        # Table over distinct features only; failed evaluations stay NaN
+        self.compiled = compile_transformations(transformations, dps)
+        table = evaluate_table(self.compiled, feature_values[feature_first])
+
+        # Expand back to every original (feature, transformation) pair
+        count = len(self.transform_names)
+        pair_labels, first = equivalence_classes(table.ravel(), rtol)
+        full = pair_labels.reshape(table.shape)[feature_labels]
+        full[feature_labels < 0] = -1
+        self.values = table.ravel()[first]
+        self._labels = full.ravel()
+        self._order = np.argsort(self._labels, kind='stable')
+        self._bounds = np.searchsorted(self._labels[self._order], np.arange(first.size + 1))
+        self.pairs = feature_values.size * count
+
+    def __len__(self):
+        return self.values.size
+
+    def __repr__(self):
+        return f"CandidateTable({self.pairs} candidates in {len(self)} classes)"
+
+    def members(self, cls):
+        """(feature, transformation) names of class `cls` in catalog order"""
+        if not 0 <= cls < len(self):
+            raise ValueError(f"No candidate class {cls} (best() found no match?)")
+        flat = self._order[self._bounds[cls]:self._bounds[cls + 1]]
+        count = len(self.transform_names)
+        return [(self._feature_name(i // count), self.transform_names[i % count]) for i in flat]
+
+    def formulas(self, cls):
+        """Distinct formula texts of class `cls`, first one as the catalog reports it"""
+        return list(dict.fromkeys(formula(f, t) for f, t in self.members(cls)))
+
+    def nearest(self, target, count=None, accept=None):
+        """Classes by distance to target -> [(cls, value, error)], closest first
+
+        accept masks usable classes; equal errors keep catalog order.
+        """
+        error = np.abs(self.values - target)
+        if accept is not None:
+            error = np.where(accept, error, np.nan)
+        usable = np.flatnonzero(~np.isnan(error))
+        order = usable[np.argsort(error[usable], kind='stable')][:count]
+        return [(int(cls), float(self.values[cls]), float(error[cls])) for cls in order]
+
+    def best(self, target, accept=None):
+        """Closest class to target -> (cls, value, error); accept masks usable classes
+
+        Returns (NO_MATCH, nan, inf) when no class is usable.
+        """
+        error = np.abs(self.values - target)
+        if accept is not None:
+            error = np.where(accept, error, np.nan)
+        if np.all(np.isnan(error)):
+            return NO_MATCH, float('nan'), float('inf')
+        cls = int(np.nanargmin(error))
+        return cls, float(self.values[cls]), float(error[cls])
@@ -1,8 +1,9 @@
 import math
 import cmath
-from mpmath import mp, sin, asin, pi, sqrt
+from mpmath import mp, sin, pi, sqrt
 import numpy as np
 from collections import defaultdict
+import lz_store
 
 mp.dps = 100
 
@@ -12,17 +13,8 @@ print("=" * 80)
 # PURE MATHEMATICAL CALCULUS
 def calculate_complex_structure():
     """Pure calculus of LZ complex structure"""
-    LZ0 = mp.mpf('0.8934691018292812244027')
-    
-    # Calculate upward complex levels
-    current = asin(LZ0)
-    complex_levels = []
-    
-    for i in range(1, 20):
-        current = asin(current)
-        complex_levels.append(current)
-    
-    return complex_levels
+    # Upward complex levels LZ-1 .. LZ-19 at 100 digits (shared asin engine)
+    return lz_store.load_upward(19, dps=100)
 
 # Calculate the complex structure
 complex_levels = calculate_complex_structure()
@@ -0,0 +1,185 @@
+import os
+import ast
+import random
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+
+from mpmath import mp, mpf
+
+from lz_maps import KAPPA_SEED, KAPPA_CURVATURE
+from lz_store import compute_levels, compute_upward
+import lz_zoo
+from lz_zoo import build_zoo
+
+"""
+LOGOS THEORY - SEED PERTURBATION STUDY
+Author: Martin Doina
+
+Which catalog matches survive a change in the decimal digits of κ?
+Every perturbed seed gets its own LZ ladder, complex upward levels and
+best-match search, farmed out across a process pool; a match is stable
+when the perturbed seeds keep choosing the same formula for a target.
+
+The search is the catalog's own: its transformations dict, ladder and
+upward depths and zoo kinds are read out of the script source, so the
+baseline reproduces the table the catalog prints.
+"""
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CATALOG = 'codata_imaginary.py'
+
+
+def _catalog_tree(script):
+    path = script if os.path.isabs(script) else os.path.join(HERE, script)
+    with open(path, 'r', encoding='utf-8') as f:
+        return path, ast.parse(f.read(), path)
+
+
+def catalog_targets(script=CATALOG, name='codata_constants'):
+    """Read a target dict literal out of a catalog script without running it"""
+    path, tree = _catalog_tree(script)
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(getattr(t, 'id', None) == name for t in node.targets):
+            return ast.literal_eval(node.value)
+    raise KeyError(f"{path} has no top-level '{name}' dict")
+
+
+@lru_cache(maxsize=None)
+def catalog_transformations(script=CATALOG, name='transformations'):
+    """Build a catalog's transformations dict without running the script
+
+    Only the imports, the precision settings (mp.dps = ...) and the
+    top-level assignments the dict depends on (phi = ...) are executed;
+    the caller's mpmath precision is restored afterwards. The lambdas keep
+    the script as their source file, so lz_transform compiles them as it
+    does inside the catalog.
+    """
+    path, tree = _catalog_tree(script)
+    assignments = {t.id: node for node in tree.body if isinstance(node, ast.Assign)
+                   for t in node.targets if isinstance(t, ast.Name)}
+    if name not in assignments:
+        raise KeyError(f"{path} has no top-level '{name}' dict")
+    needed, pending = set(), [assignments[name]]
+    while pending:
+        for n in ast.walk(pending.pop()):
+            if isinstance(n, ast.Name) and n.id in assignments and n.id not in needed:
+                needed.add(n.id)
+                pending.append(assignments[n.id])
+    body = [node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))
+            or (isinstance(node, ast.Assign) and any(getattr(t, 'id', None) in needed
+                                                     or getattr(t, 'attr', None) in ('dps', 'prec')
+                                                     for t in node.targets))]
+    namespace = {'__name__': 'catalog', '__file__': path}
+    with mp.workdps(mp.dps):
+        exec(compile(ast.Module(body, []), path, 'exec'), namespace)
+    return namespace[name]
+
+
+def catalog_depths(script=CATALOG):
+    """(ladder depth, upward depth) of the lz_levels / upward_levels calls in a catalog"""
+    _, tree = _catalog_tree(script)
+    depths = {}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.args \
+                and node.func.attr in ('lz_levels', 'upward_levels'):
+            depths.setdefault(node.func.attr, ast.literal_eval(node.args[0]))
+    return depths['lz_levels'], depths['upward_levels']
+
+
+def digit_perturbations(seed=KAPPA_SEED):
+    """(label, seed) pairs with each decimal digit moved up and down by one"""
+    head, digits = seed.split('.')
+    seeds = []
+    for i, d in enumerate(digits):
+        for delta in (-1, 1):
+            new = int(d) + delta
+            if 0 <= new <= 9:
+                seeds.append((f'digit {i + 1} {delta:+d}', f'{head}.{digits[:i]}{new}{digits[i + 1:]}'))
+    return seeds
+
+
+def random_perturbations(seed=KAPPA_SEED, tolerance=1e-15, count=100, rng_seed=0):
+    """(label, seed) pairs uniformly within ±tolerance of the seed"""
+    rng = random.Random(rng_seed)
+    digits = len(seed.split('.')[1]) + 5
+    with mp.workdps(digits + 5):
+        base = mpf(seed)
+        return [(f'random {k}', mp.nstr(base + mpf(rng.uniform(-tolerance, tolerance)), digits))
+                for k in range(count)]
+
+
+def level_zoo(seed, dps=50, depth=46, upward=14):
+    """The catalog zoo (see lz_zoo) for one seed, computed without the cache"""
+    real = [float(v) for v in compute_levels(depth, seed, dps, 'sine')]
+    with mp.workdps(dps):
+        levels = [complex(z) for z in compute_upward(upward, seed, dps)]
+    return build_zoo(real, levels)
+
+
+def candidate_table(zoo, script=CATALOG, dps=50):
+    """Every (feature, transformation) value of the catalog search over a zoo"""
+    return lz_zoo.CandidateTable(zoo, catalog_transformations(script), dps=dps)
+
+
+def best_matches(candidates, targets):
+    """Best catalog formula per target -> {target: (formula, value, error)}"""
+    matches = {}
+    for target, experimental in targets.items():
+        cls, value, error = candidates.best(experimental)
+        formula = lz_zoo.formula(*candidates.members(cls)[0]) if cls != lz_zoo.NO_MATCH else ""
+        matches[target] = (formula, value, error)
+    return matches
+
+
+def _evaluate(job):
+    label, seed, targets, script, dps = job
+    depth, upward = catalog_depths(script)
+    zoo = level_zoo(seed, dps, depth, upward)
+    return label, seed, best_matches(candidate_table(zoo, script, dps), targets)
+
+
+def run_study(seeds, targets=None, script=CATALOG, baseline=KAPPA_SEED,
+              dps=50, workers=None, chunksize=8):
+    """Recompute the catalog for every (label, seed) and report stable matches
+
+    Returns {'baseline': {...}, 'stability': {target: fraction unchanged},
+             'changed': {label: [targets whose formula moved]}}.
+    """
+    if targets is None:
+        targets = catalog_targets(script)
+    jobs = [(label, seed, targets, script, dps) for label, seed in seeds]
+    _, _, reference = _evaluate(('baseline', baseline, targets, script, dps))
+
+    changed = {}
+    unchanged = {target: 0 for target in targets}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for label, seed, matches in pool.map(_evaluate, jobs, chunksize=chunksize):
+            moved = [t for t in targets if matches[t][0] != reference[t][0]]
+            if moved:
+                changed[label] = moved
+            for t in targets:
+                unchanged[t] += matches[t][0] == reference[t][0]
+
+    total = max(len(jobs), 1)
+    return {
+        'baseline': reference,
+        'stability': {t: unchanged[t] / total for t in targets},
+        'changed': changed,
+    }
+
+
+if __name__ == "__main__":
+    print("SEED PERTURBATION STUDY: κ digits vs catalog best matches")
+    print("=" * 80)
+    seeds = digit_perturbations(KAPPA_SEED) + random_perturbations(KAPPA_SEED, 1e-12, 200)
+    seeds.append(('κ_curvature (200 digits)', KAPPA_CURVATURE))
+    study = run_study(seeds)
+
+    print(f"{'Constant':<30} {'Baseline Formula':<28} {'Stable':<8}")
+    print("-" * 80)
+    for target, (formula, _, _) in study['baseline'].items():
+        print(f"{target:<30} {formula:<28} {study['stability'][target] * 100:6.1f}%")
+
+    print(f"\nPerturbations that moved a best match: {len(study['changed'])}/{len(seeds)}")
+    for label, moved in list(study['changed'].items())[:20]:
+        print(f"  {label:<28} {', '.join(moved)}")
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The lz_* modules are flat scripts next to the catalogs, not a package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -0,0 +1,16 @@
+from mpmath import mp
+
+import lz_store
+from lz_audit import choose_upward
+
+
+def test_mpmath_levels_come_from_the_upward_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(lz_store, 'CACHE_DIR', str(tmp_path))
+    seeds = ['0.5', '1.5']
+    # no float level keeps more digits than a float64 has
+    values, float_levels = choose_upward(seeds, 30, digits=18)
+    assert float_levels == 0
+    assert len(list(tmp_path.iterdir())) == len(seeds)
+    with mp.workdps(50):
+        expected = [complex(z) for z in lz_store.compute_upward(30, '1.5', 50)]
+    assert values[1].tolist() == expected
@@ -0,0 +1,19 @@
+import numpy as np
+
+from lz_basin import LOWER, NONFINITE, UNCAPTURED, UPPER, basin_tile
+
+
+def test_points_are_classified_by_the_petal_that_captures_them():
+    tile = basin_tile(np.array([0.1j, -0.1j, 1.5, 1.5 - 1j, 0.05]), max_iter=100)
+    assert tile['behaviour'].tolist() == [UPPER, LOWER, UPPER, LOWER, UNCAPTURED]
+    # already inside a petal: captured on the first step
+    assert tile['iterations'][:2].tolist() == [1, 1]
+    # the real axis lies between the petals: the chain stays real for a while
+    assert tile['iterations'][4] == 100 and tile['real_levels'][4] == 100
+
+
+def test_off_axis_points_are_all_captured():
+    z = np.array([2 + 3j, -1.5, 0.3 - 0.2j, 1j])
+    tile = basin_tile(z, max_iter=500)
+    assert UNCAPTURED not in tile['behaviour'] and NONFINITE not in tile['behaviour']
+    assert (tile['iterations'] < 500).all()
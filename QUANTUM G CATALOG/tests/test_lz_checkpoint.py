@@ -0,0 +1,31 @@
+import pytest
+
+from lz_checkpoint import load_checkpoint, resume_lz, run_lz
+
+
+class Interrupted(Exception):
+    pass
+
+
+def _interrupt_at(n):
+    def sink(step, state):
+        if step == n:
+            raise Interrupted
+    return sink
+
+
+@pytest.mark.parametrize('recursion, seed', [('logos', '0.9'), ('sine', '-0.5')])
+def test_resume_is_bit_for_bit(tmp_path, recursion, seed):
+    straight = tmp_path / 'straight.json'
+    _, expected = run_lz(str(straight), 250, seed, dps=60, recursion=recursion, every=40)
+
+    path = tmp_path / 'interrupted.json'
+    with pytest.raises(Interrupted):
+        run_lz(str(path), 250, seed, dps=60, recursion=recursion, every=40, sink=_interrupt_at(130))
+    assert load_checkpoint(str(path))['step'] == 120
+    step, state = resume_lz(str(path), 250, every=40)
+
+    assert step == 250
+    assert state._mpf_ == expected._mpf_
+    assert load_checkpoint(str(path))['state']._mpf_ == expected._mpf_
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['interrupted.json', 'straight.json']
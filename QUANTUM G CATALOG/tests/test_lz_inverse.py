@@ -0,0 +1,22 @@
+import pytest
+from mpmath import mp, mpf
+
+from lz_maps import KAPPA_SEED
+from lz_inverse import walk_back
+from lz_store import compute_levels
+
+
+def test_float_walk_back_warns_about_lost_digits():
+    levels = compute_levels(16, dps=50)
+    with pytest.warns(RuntimeWarning, match='pass a larger dps'):
+        path = walk_back([float(levels[15])], 15)
+    # Fifteen divisions by the slope (~0.039) leave nothing of the seed
+    assert not abs(path[0, -1] - float(KAPPA_SEED)) < 1e-6
+
+
+def test_mp_walk_back_does_not_drift():
+    levels = compute_levels(16, dps=80)
+    path = walk_back([levels[15]], 15, dps=60)
+    with mp.workdps(60):
+        for k in range(16):
+            assert abs(path[0, k] - levels[15 - k]) < mpf(10) ** -40
@@ -0,0 +1,38 @@
+import pytest
+
+import lz_maps
+from mpmath import mpc, mpf
+
+from lz_jump import fit_tail, fit_upward, jump_upward
+from lz_maps import LOGOS_FAMILY, register_recursion
+from lz_store import compute_upward
+
+
+@pytest.fixture
+def repelling():
+    # 4 sin ψ: the fixed point at 0 has slope 4
+    name = 'test-repelling'
+    register_recursion(name, LOGOS_FAMILY.bind(a=4, b=0))
+    yield name
+    for table in (lz_maps.MAPS, lz_maps.RECURSIONS, lz_maps.DERIVATIVES,
+                  lz_maps.FLOAT_RECURSIONS, lz_maps.FLOAT_DERIVATIVES):
+        table.pop(name, None)
+
+
+def test_fit_tail_refuses_a_non_attracting_map(repelling):
+    with pytest.raises(ValueError, match='does not converge'):
+        fit_tail('0.5', dps=30, recursion=repelling)
+
+
+def test_fit_tail_settles_on_the_logos_attractor():
+    fit = fit_tail(dps=40)
+    assert fit['kind'] == 'attracting'
+    assert fit['verified_digits'] == 40
+
+
+def test_jump_upward_follows_the_cmath_branch_for_seeds_above_one():
+    fit = fit_upward('1.5', dps=30)
+    assert abs(jump_upward(fit, 1) - mpc('0.94935750178', '1.27677657142')) < mpf('1e-10')
+    levels = compute_upward(fit['checkpoint'] + 10, '1.5', dps=40)
+    for k in (2, fit['checkpoint'] + 1, fit['checkpoint'] + 10):
+        assert abs(jump_upward(fit, k) - levels[k - 1]) < mpf('1e-25')
@@ -0,0 +1,11 @@
+import numpy as np
+
+from lz_lyapunov import asin_lyapunov
+from lz_sweep import sweep_upward
+
+
+def test_asin_chain_follows_sweep_upward_beyond_one():
+    seeds = [1.5, -1.5, 0.8934691018292812, -0.3]
+    result = asin_lyapunov(seeds, 6)
+    assert np.all(np.isfinite(result['exponent']))
+    np.testing.assert_array_equal(result['final'], sweep_upward(seeds, 6)[:, -1])
@@ -0,0 +1,43 @@
+import numpy as np
+from mpmath import iv, mp, mpf
+
+from lz_maps import LOGOS_FAMILY, SINE_FAMILY, RecursionFamily, get_recursion
+from lz_sequence import column_step
+
+
+def test_default_members_match_the_plain_recursions():
+    logos, sine = get_recursion('logos'), get_recursion('sine')
+    with mp.workdps(80):
+        x = y = mpf('0.3')
+        for _ in range(200):
+            x, y = logos(x), mp.sin(y) + mp.exp(-y)
+        assert x == y
+        assert sine(mpf(1)) == mp.sin(1)
+    interval = logos(iv.mpf('0.5'), iv)
+    assert interval.a <= mp.sin(0.5) + mp.exp(-0.5) <= interval.b
+
+
+def test_bound_member_backends_agree():
+    member = LOGOS_FAMILY.bind(a='0.5', c=2)
+    with mp.workdps(30):
+        expected = mpf('0.5') * mp.sin(1) + mp.exp(-2)
+        assert member.mp_map(mpf(1)) == expected
+    out = member.float_map(np.array([1.0]), np.empty(1))
+    assert out[0] == 0.5 * np.sin(1.0) + np.exp(-2.0)
+    assert np.allclose(member.float_slope(np.array([1.0])), 0.5 * np.cos(1.0) - 2 * np.exp(-2.0))
+
+
+def test_family_without_a_derivative_uses_complex_step():
+    square = RecursionFamily(lambda x, ctx, c=1: c * x * x - 1)
+    assert square.defaults == {'c': 1}
+    assert np.allclose(square.bind(c=2).float_slope(np.array([3.0])), 12.0)
+
+
+def test_columns_hook():
+    assert column_step('logos') is not None and column_step('sine') is not None
+    assert LOGOS_FAMILY.bind(c=2).column_step() is None
+    step = LOGOS_FAMILY.bind(a='0.5').column_step()
+    with mp.workdps(40):
+        s, e = mp.sin(1), mp.exp(-1)
+        assert step(s, e) == mpf('0.5') * s + e
+    assert SINE_FAMILY.bind().column_step()(0.25, 9.0) == 0.25
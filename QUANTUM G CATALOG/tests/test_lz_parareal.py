@@ -0,0 +1,21 @@
+from lz_parareal import parareal_lz
+from lz_sequence import take_lz
+
+
+def test_parareal_matches_take_lz():
+    result = parareal_lz(400, dps=200, segments=4, workers=2)
+    assert not result['serial']
+    assert result['levels'] == take_lz(400, dps=200)
+
+
+def test_rounds_do_not_grow_with_segments():
+    rounds = {segments: parareal_lz(400, dps=200, segments=segments, workers=2)['iterations']
+              for segments in (2, 4, 8)}
+    # Converging the starts costs precision doublings, not one round per segment
+    assert rounds[8] == rounds[2] < 8
+
+
+def test_sine_falls_back_to_serial():
+    result = parareal_lz(50, dps=30, recursion='sine', segments=4, workers=2)
+    assert result['serial']
+    assert result['levels'] == take_lz(50, dps=30, recursion='sine')
@@ -0,0 +1,37 @@
+import os
+import stat
+
+import pytest
+from mpmath import mp, mpf
+
+import lz_store
+
+
+def test_negative_levels_keep_their_sign(tmp_path, monkeypatch):
+    monkeypatch.setattr(lz_store, 'CACHE_DIR', str(tmp_path))
+    computed = lz_store.load_levels(6, seed='-0.5', dps=40, recursion='sine')
+    assert all(v < 0 for v in computed)
+    assert list(tmp_path.iterdir())
+    assert lz_store.load_levels(6, seed='-0.5', dps=40, recursion='sine') == computed
+
+
+def test_signed_man_exp_round_trip():
+    with mp.workdps(40):
+        for value in (mpf('-1.25'), mpf('3') / 7, -mp.pi, mpf(0)):
+            man, exp = lz_store._signed_man_exp(value)
+            assert mpf((man, exp)) == value
+
+
+def test_upward_parts_keep_their_sign(tmp_path, monkeypatch):
+    monkeypatch.setattr(lz_store, 'CACHE_DIR', str(tmp_path))
+    computed = lz_store.load_upward(5, seed='-1.5', dps=40)
+    assert any(v.real < 0 for v in computed) or any(v.imag < 0 for v in computed)
+    assert lz_store.load_upward(5, seed='-1.5', dps=40) == computed
+
+
+@pytest.mark.skipif(os.name != 'posix', reason='POSIX file modes')
+def test_cache_files_are_world_readable(tmp_path, monkeypatch):
+    monkeypatch.setattr(lz_store, 'CACHE_DIR', str(tmp_path))
+    lz_store.load_levels(3, dps=20)
+    (path,) = tmp_path.iterdir()
+    assert stat.S_IMODE(path.stat().st_mode) == 0o644
@@ -0,0 +1,36 @@
+from mpmath import mp, mpf
+
+from lz_sequence import take_lz
+from lz_table import LZTable, build_table, write_table
+
+
+def test_round_trip_negative_seed(tmp_path):
+    path = str(tmp_path / 'sine.lzt')
+    assert build_table(path, 40, seed='-0.75', dps=50, recursion='sine') == 40
+    table = LZTable(path)
+    try:
+        expected = take_lz(40, '-0.75', 50, 'sine')
+        assert [v._mpf_ for v in table] == [v._mpf_ for v in expected]
+        assert table[5:7] == expected[5:7] and table.seed == '-0.75'
+    finally:
+        table.close()
+
+
+def test_depth_zero(tmp_path):
+    path = str(tmp_path / 'empty.lzt')
+    assert build_table(path, 0, dps=30) == 0
+    table = LZTable(path)
+    assert len(table) == 0 and list(table) == []
+
+
+def test_wider_values_are_rounded_to_the_table(tmp_path):
+    path = str(tmp_path / 'wide.lzt')
+    with mp.workdps(80):
+        wide = [mp.pi, -mp.e / 3]
+    assert write_table(path, iter(wide + [0.5]), 3, dps=30) == 3
+    table = LZTable(path)
+    try:
+        with mp.workdps(30):
+            assert table[:] == [+wide[0], +wide[1], mpf(0.5)]
+    finally:
+        table.close()
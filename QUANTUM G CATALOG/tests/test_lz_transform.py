@@ -0,0 +1,39 @@
+import numpy as np
+from mpmath import mp, mpf
+
+import lz_transform
+
+
+def test_non_numeric_constants_stay_on_the_slow_path():
+    compiled = lz_transform.compile_transformations({
+        'half': mpf(1) / 2,
+        'complex': 1 + 2j,
+        'text': 'not a number',
+        'numeric text': '2.5',
+        'LZ/2': lambda x: x / 2,
+    }, dps=30)
+    assert compiled['half'].constant and compiled['numeric text'].constant
+    assert not compiled['complex'].vectorized and not compiled['text'].vectorized
+    table = lz_transform.evaluate_table(compiled, [1.0, 3.0])
+    np.testing.assert_array_equal(table[:, [0, 3, 4]], [[0.5, 2.5, 0.5], [0.5, 2.5, 1.5]])
+    assert np.isnan(table[:, [1, 2]]).all()
+
+
+def test_hoisted_constants_match_mpmath():
+    phi = (1 + mp.sqrt(5)) / 2
+    compiled = lz_transform.compile_transformations({'LZ/φ³': lambda x: x / phi**3}, dps=50)
+    assert compiled['LZ/φ³'].vectorized
+    assert compiled['LZ/φ³'](np.array([2.0]))[0] == float(2 / phi**3)
+
+
+def test_scaling_family_finds_the_exact_power():
+    phi = (1 + mp.sqrt(5)) / 2
+    family = lz_transform.ScalingFamily({'φ': (phi, range(-20, 21)), 'π': (mp.pi, range(-10, 11))}, dps=50)
+    assert len(family) == 41 * 21
+    target = float(0.7 * phi**10 / mp.pi**5)
+    feature, index, value, error = family.best([1.3, 0.7, np.nan], target)
+    assert feature == 1 and family.name(index) == 'LZ×φ¹⁰×π⁻⁵'
+    assert error <= 1e-15 * target
+    feature, index, value, error = family.best([np.nan], target)
+    assert feature == index == lz_transform.NO_MATCH
+    assert np.isnan(value) and error == float('inf')
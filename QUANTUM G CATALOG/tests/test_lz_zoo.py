@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+import lz_zoo
+
+TRANSFORMATIONS = {
+    'LZ/2': lambda x: x / 2,
+    'LZ × 0.5': lambda x: x * 0.5,
+    '3 × LZ': lambda x: 3 * x,
+}
+
+
+@pytest.fixture
+def zoo():
+    return lz_zoo.build_zoo(real=[1.5, 0.75], upward=[0.25 + 2j, -1.0 + 0.5j, 3.0 + 0j],
+                            kinds=lz_zoo.KINDS + ('_mag_p5',))
+
+
+def test_unused_kinds_stay_unmaterialized(zoo):
+    candidates = lz_zoo.CandidateTable(zoo, TRANSFORMATIONS, kinds=('', '_imag'))
+    assert set(zoo._columns) == set(zoo.kind_codes(('', '_imag')))
+    cls, value, error = candidates.best(1.0)
+    assert (value, error) == (1.0, 0.0)
+    assert set(zoo._columns) == set(zoo.kind_codes(('', '_imag')))
+
+
+def test_zoo_table_matches_dict_table(zoo):
+    from_zoo = lz_zoo.CandidateTable(zoo, TRANSFORMATIONS)
+    from_dict = lz_zoo.CandidateTable(dict(zoo.items()), TRANSFORMATIONS)
+    assert from_zoo.pairs == from_dict.pairs == len(zoo) * len(TRANSFORMATIONS)
+    np.testing.assert_array_equal(from_zoo.values, from_dict.values)
+    for cls in range(len(from_zoo)):
+        assert from_zoo.members(cls) == from_dict.members(cls)
+
+
+def test_feature_by_name(zoo):
+    assert zoo.feature('LZ-1_imag') == 2.0
+    assert zoo.feature('LZ1') == 0.75
+    assert np.isnan(zoo.feature('LZ-3_inv_imag'))
+    assert repr(zoo).endswith('3 materialized)')
+    with pytest.raises(KeyError):
+        zoo.feature('LZ-9_imag')
+
+
+def test_best_without_a_usable_class(zoo):
+    candidates = lz_zoo.CandidateTable(zoo, TRANSFORMATIONS)
+    cls, value, error = candidates.best(1.0, accept=np.zeros(len(candidates), dtype=bool))
+    assert cls == lz_zoo.NO_MATCH and np.isnan(value) and error == float('inf')
+    with pytest.raises(ValueError):
+        candidates.members(cls)
+
+
+def test_equivalence_classes_do_not_chain():
+    # Each neighbour agrees to rtol, but the ends are 3 rtol apart
+    rtol = 1e-9
+    values = 1.0 + np.arange(4) * 0.9 * rtol
+    labels, first = lz_zoo.equivalence_classes(values[::-1], rtol)
+    assert labels.tolist() == [0, 0, 1, 1]
+    assert first.tolist() == [0, 2]
+    labels, _ = lz_zoo.equivalence_classes([2.0, np.nan, 2.0, 3.0])
+    assert labels.tolist() == [0, -1, 0, 1]
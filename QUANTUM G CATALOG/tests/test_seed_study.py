@@ -0,0 +1,14 @@
+from mpmath import mp
+
+import seed_study
+
+
+def test_catalog_constants_use_the_catalog_precision():
+    before = mp.prec
+    transformations = seed_study.catalog_transformations('codata_imaginary.py')
+    assert mp.prec == before
+    with mp.workdps(50):
+        phi = (1 + mp.sqrt(5)) / 2
+        assert transformations['1/φ'] == 1 / phi
+    # 53-bit phi would carry a 53-bit mantissa
+    assert transformations['1/φ']._mpf_[3] > 53
@@ -1,6 +1,9 @@
-import math
-import cmath
 from mpmath import mp, sin, asin, pi, sqrt
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'QUANTUM G CATALOG'))
+import lz_store
+import lz_zoo
 
 """
 LOGOS THEORY - GOLDEN RATIO MAPPING
@@ -25,83 +28,24 @@ nuclear_binding_data = {
 }
 
 # REAL LZ levels (sine iterates)
-real_lz_levels = {
-    'LZ0': 0.8934691018292812244027,
-    'LZ1': 0.77925056166461613546,     
-    'LZ2': 0.70274643589057133551,      
-    'LZ3': 0.646315844994190005925,    
-    'LZ4': 0.602249409166941011016,     
-    'LZ5': 0.566497560827266638609, 
-    'LZ6': 0.536680037956250069056,  
-    'LZ7': 0.511285603178539657953,      
-    'LZ8': 0.48929884626327098115,      
-    'LZ9': 0.470007121557258645354,   
-    'LZ10': 0.452892634722198191231,
-    'LZ11': 0.437568375282611265813,
-    'LZ12': 0.423738191480105923173,
-    'LZ13': 0.411170897372839147563,
-    'LZ14': 0.399682908854264909393, 
-    'LZ15': 0.38912626245028160807,
-    'LZ16': 0.379380142329113925443,
-    'LZ17': 0.370344758293618177551,
-    'LZ18': 0.361936838052865187321,
-    'LZ19': 0.354086251973120615728,
-    'LZ20': 0.346733447618190129634,
-}
+real_lz_levels = lz_store.lz_levels(21, dps=50, recursion='sine')
 
 # COMPLEX LZ levels (analytic continuation)
 print("Calculating COMPLEX LZ levels (analytic continuation)...")
-lz0 = real_lz_levels['LZ0']
-a0 = math.asin(lz0)
-
-complex_lz_levels = {}
-current = a0
-for i in range(1, 25):
-    try:
-        current = cmath.asin(current)
-        complex_lz_levels[f'LZ-{i}'] = current
-        # Print first few to verify
-        if i <= 5:
-            print(f"LZ-{i}: {current}")
-    except:
-        break
+complex_lz_levels = lz_store.upward_levels(24, dps=50)
+# Print first few to verify
+for i in range(1, 6):
+    print(f"LZ-{i}: {complex_lz_levels[f'LZ-{i}']}")
 
 print(f"Generated {len(complex_lz_levels)} complex levels")
 
 # Build QUANTUM ZOO with all levels
-quantum_levels = {}
+# REAL levels as-is (kind ''), COMPLEX levels with full properties
+zoo = lz_zoo.build_zoo(real=real_lz_levels.values(), upward=complex_lz_levels.values(), kinds=(
+    lz_zoo.LEVEL_ABS, '_real', '_imag', '_sum', '_mag', '_prod', '_inv_imag', '_inv_real')
+    + lz_zoo.powers(('real', 'imag'), (2, 3, 4)))
 
-# Add REAL levels as-is
-for name, value in real_lz_levels.items():
-    quantum_levels[name] = value
-
-# Add COMPLEX levels with full properties
-for name, complex_val in complex_lz_levels.items():
-    real_part = abs(float(complex_val.real))
-    imag_part = abs(float(complex_val.imag))
-    
-    # Store the complex value itself
-    quantum_levels[name] = complex_val
-    
-    # Store decomposed properties
-    quantum_levels[f'{name}_real'] = real_part
-    quantum_levels[f'{name}_imag'] = imag_part
-    quantum_levels[f'{name}_sum'] = real_part + imag_part
-    quantum_levels[f'{name}_mag'] = math.sqrt(real_part**2 + imag_part**2)
-    quantum_levels[f'{name}_prod'] = real_part * imag_part
-    
-    # Enhanced operations
-    if imag_part != 0:
-        quantum_levels[f'{name}_inv_imag'] = 1.0 / imag_part
-    if real_part != 0:
-        quantum_levels[f'{name}_inv_real'] = 1.0 / real_part
-    
-    # Powers for scaling
-    for power in [2, 3, 4]:
-        quantum_levels[f'{name}_real_p{power}'] = real_part ** power
-        quantum_levels[f'{name}_imag_p{power}'] = imag_part ** power
-
-print(f"Total quantum levels available: {len(quantum_levels)}")
+print(f"Total quantum levels available: {len(zoo)}")
 
 phi = float((1 + mp.sqrt(5)) / 2)
 pi_val = float(mp.pi)
@@ -134,40 +78,20 @@ transformations = {
 print(f"\n{'Nucleus':<10} {'Actual':<8} {'Best Formula':<40} {'Derived':<8} {'Error':<8} {'Level Type':<12}")
 print("-" * 90)
 
+# Every (level, transformation) value once; only 0 < value <= 20 is considered
+candidates = lz_zoo.CandidateTable(zoo, transformations)
+accept = (candidates.values > 0) & (candidates.values <= 20)
+
 results = []
 
 for nucleus, actual_value in nuclear_binding_data.items():
-    best_error = float('inf')
-    best_formula = ""
-    best_derived = 0
-    best_level_type = ""
-    
-    for lz_name, lz_val in quantum_levels.items():
-        # Handle both real and complex values
-        if isinstance(lz_val, complex):
-            lz_val_float = abs(lz_val)  # Use magnitude for complex
-            level_type = "COMPLEX"
-        else:
-            lz_val_float = float(lz_val)
-            level_type = "REAL"
-        
-        for trans_name, trans_func in transformations.items():
-            try:
-                derived = trans_func(lz_val_float)
-                
-                # Skip unreasonable values for nuclear binding
-                if derived <= 0 or derived > 20:
-                    continue
-                    
-                error = abs(derived - actual_value)
-                
-                if error < best_error:
-                    best_error = error
-                    best_formula = f"{trans_name.replace('LZ', lz_name)}"
-                    best_derived = derived
-                    best_level_type = level_type
-            except:
-                continue
+    cls, best_derived, best_error = candidates.best(actual_value, accept)
+    best_formula, best_level_type = "", ""
+    if cls != lz_zoo.NO_MATCH:
+        lz_name, trans_name = candidates.members(cls)[0]
+        best_formula = lz_zoo.formula(lz_name, trans_name)
+        # The bare upward levels are searched by magnitude and count as complex
+        best_level_type = "COMPLEX" if lz_name in complex_lz_levels else "REAL"
     
     results.append((nucleus, actual_value, best_formula, best_derived, best_error, best_level_type))
 
@@ -1,6 +1,11 @@
 import math
-import cmath
 from mpmath import mp, pi, sqrt
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'QUANTUM G CATALOG'))
+import lz_store
+import lz_zoo
+import lz_transform
 
 """
 LOGOS THEORY - GOLDEN RATIO MAPPING
@@ -25,39 +30,17 @@ for name, value in quantum_hall_data.items():
 
 # LOGOS seed and complex levels
 lz0 = 0.8934691018292812244027
-a0 = math.asin(lz0)
 
 print(f"\nGenerating LOGOS complex levels from seed: {lz0}")
 
-complex_levels = {}
-current = a0
-for i in range(1, 30):  # Extended for high precision
-    try:
-        current = cmath.asin(current)
-        complex_levels[f'LZ-{i}'] = current
-    except:
-        break
+complex_levels = lz_store.upward_levels(29, dps=50)
 
 print(f"Generated {len(complex_levels)} complex levels")
 
 # Build quantum zoo
-quantum_levels = {}
-for name, complex_val in complex_levels.items():
-    real_part = abs(float(complex_val.real))
-    imag_part = abs(float(complex_val.imag))
-    
-    quantum_levels[name] = complex_val
-    quantum_levels[f'{name}_real'] = real_part
-    quantum_levels[f'{name}_imag'] = imag_part
-    quantum_levels[f'{name}_sum'] = real_part + imag_part
-    quantum_levels[f'{name}_mag'] = math.sqrt(real_part**2 + imag_part**2)
-    quantum_levels[f'{name}_prod'] = real_part * imag_part
-    
-    # High powers for large numbers
-    for power in [2, 3, 4, 5, 6, 7, 8]:
-        quantum_levels[f'{name}_real_p{power}'] = real_part ** power
-        quantum_levels[f'{name}_imag_p{power}'] = imag_part ** power
-        quantum_levels[f'{name}_mag_p{power}'] = quantum_levels[f'{name}_mag'] ** power
+zoo = lz_zoo.build_zoo(upward=complex_levels.values(), kinds=(
+    lz_zoo.LEVEL_ABS, '_real', '_imag', '_sum', '_mag', '_prod')
+    + lz_zoo.powers(('real', 'imag', 'mag'), range(2, 9)))
 
 phi = float((1 + mp.sqrt(5)) / 2)
 pi_val = float(mp.pi)
@@ -96,36 +79,15 @@ transformations = {
 print(f"\n{'Quantum Constant':<25} {'Target':<15} {'Best Formula':<45} {'Derived':<15} {'Error':<12} {'Precision':<12}")
 print("-" * 120)
 
+# Every (level, transformation) value once; only 0 < value <= 1e7 is considered
+candidates = lz_zoo.CandidateTable(zoo, transformations)
+accept = (candidates.values > 0) & (candidates.values <= 1e7)
+
 results = []
 
 for const_name, target_value in quantum_hall_data.items():
-    best_error = float('inf')
-    best_formula = ""
-    best_derived = 0
-    
-    for lz_name, lz_val in quantum_levels.items():
-        if isinstance(lz_val, complex):
-            lz_val_float = abs(lz_val)
-        else:
-            lz_val_float = float(lz_val)
-        
-        for trans_name, trans_func in transformations.items():
-            try:
-                derived = trans_func(lz_val_float)
-                
-                # Skip unreasonable values
-                if derived <= 0 or derived > 1e7:
-                    continue
-                    
-                error = abs(derived - target_value)
-                relative_error = error / target_value
-                
-                if error < best_error:
-                    best_error = error
-                    best_formula = f"{trans_name.replace('LZ', lz_name)}"
-                    best_derived = derived
-            except:
-                continue
+    cls, best_derived, best_error = candidates.best(target_value, accept)
+    best_formula = lz_zoo.formula(*candidates.members(cls)[0]) if cls != lz_zoo.NO_MATCH else ""
     
     relative_error = best_error / target_value
     precision = f"1 in {int(1/relative_error):,}" if relative_error > 0 else "EXACT"
@@ -158,3 +120,23 @@ elif von_klitzing_result[5] < 1e-6:
     print(" EXCELLENT MATCH (1 in 10^6)")
 elif von_klitzing_result[5] < 1e-3:
     print(" GOOD MATCH (1 in 10^3)")
+
+# PARAMETRIC FAMILY: the whole φ^i × π^j × 10^k grid instead of hand-picked powers
+family = lz_transform.ScalingFamily({
+    'φ': ((1 + mp.sqrt(5)) / 2, range(-20, 21)),
+    'π': (mp.pi, range(-10, 11)),
+    '10': (10, range(-5, 6)),
+})
+# Every (level, kind) cell of the zoo, row-major; absent features are NaN
+level_values = zoo.block().ravel()
+
+print(f"\nFAMILY SEARCH: {family}")
+print(f"{'Quantum Constant':<25} {'Target':<15} {'Best Formula':<45} {'Derived':<15} {'Precision':<12}")
+print("-" * 120)
+for const_name, target_value in quantum_hall_data.items():
+    feature, index, derived, error = family.best(level_values, target_value)
+    relative_error = error / target_value
+    precision = f"1 in {int(1/relative_error):,}" if relative_error > 0 else "EXACT"
+    best_formula = (family.name(index, zoo.name(*divmod(feature, len(zoo.kinds))))
+                    if feature != lz_transform.NO_MATCH else "")
+    print(f"{const_name:<25} {target_value:<15} {best_formula:<45} {derived:<15.6f} {precision:<12}")
@@ -1,6 +1,10 @@
 import math
-import cmath
 from mpmath import mp, pi, sqrt
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'QUANTUM G CATALOG'))
+import lz_store
+import lz_zoo
 
 """
 LOGOS THEORY - GOLDEN RATIO MAPPING
@@ -33,41 +37,13 @@ print("Target Quantum Phenomena:")
 for name, value in quantum_data.items():
     print(f"{name}: {value}")
 
-# LOGOS complex levels
-lz0 = 0.8934691018292812244027
-a0 = math.asin(lz0)
-
-complex_levels = {}
-current = a0
-for i in range(1, 25):
-    try:
-        current = cmath.asin(current)
-        complex_levels[f'LZ-{i}'] = current
-    except:
-        break
+# LOGOS complex levels (shared asin engine, seed κ)
+complex_levels = lz_store.upward_levels(24, dps=50)
 
 # Build quantum zoo
-quantum_levels = {}
-for name, complex_val in complex_levels.items():
-    real_part = abs(float(complex_val.real))
-    imag_part = abs(float(complex_val.imag))
-    
-    quantum_levels[name] = complex_val
-    quantum_levels[f'{name}_real'] = real_part
-    quantum_levels[f'{name}_imag'] = imag_part
-    quantum_levels[f'{name}_sum'] = real_part + imag_part
-    quantum_levels[f'{name}_mag'] = math.sqrt(real_part**2 + imag_part**2)
-    quantum_levels[f'{name}_prod'] = real_part * imag_part
-    
-    # Powers and inverses
-    for power in [2, 3, 4]:
-        quantum_levels[f'{name}_real_p{power}'] = real_part ** power
-        quantum_levels[f'{name}_imag_p{power}'] = imag_part ** power
-    
-    if imag_part != 0:
-        quantum_levels[f'{name}_inv_imag'] = 1.0 / imag_part
-    if real_part != 0:
-        quantum_levels[f'{name}_inv_real'] = 1.0 / real_part
+zoo = lz_zoo.build_zoo(upward=complex_levels.values(), kinds=(
+    lz_zoo.LEVEL_ABS, '_real', '_imag', '_sum', '_mag', '_prod')
+    + lz_zoo.powers(('real', 'imag'), (2, 3, 4)) + ('_inv_imag', '_inv_real'))
 
 phi = float((1 + mp.sqrt(5)) / 2)
 pi_val = float(mp.pi)
@@ -107,35 +83,15 @@ transformations = {
 print(f"\n{'Quantum Phenomenon':<25} {'Experimental':<12} {'Best Formula':<40} {'LOGOS':<12} {'Error':<10} {'Status':<12}")
 print("-" * 110)
 
+# Every (level, transformation) value once; only 0 < value <= 100 is considered
+candidates = lz_zoo.CandidateTable(zoo, transformations)
+accept = (candidates.values > 0) & (candidates.values <= 100)
+
 results = []
 
 for phenom_name, exp_value in quantum_data.items():
-    best_error = float('inf')
-    best_formula = ""
-    best_logos_value = 0
-    
-    for lz_name, lz_val in quantum_levels.items():
-        if isinstance(lz_val, complex):
-            lz_val_float = abs(lz_val)
-        else:
-            lz_val_float = float(lz_val)
-        
-        for trans_name, trans_func in transformations.items():
-            try:
-                logos_value = trans_func(lz_val_float)
-                
-                # Skip unreasonable values
-                if logos_value <= 0 or logos_value > 100:
-                    continue
-                    
-                error = abs(logos_value - exp_value)
-                
-                if error < best_error:
-                    best_error = error
-                    best_formula = f"{trans_name.replace('LZ', lz_name)}"
-                    best_logos_value = logos_value
-            except:
-                continue
+    cls, best_logos_value, best_error = candidates.best(exp_value, accept)
+    best_formula = lz_zoo.formula(*candidates.members(cls)[0]) if cls != lz_zoo.NO_MATCH else ""
     
     relative_error = best_error / exp_value if exp_value != 0 else best_error
     status = "EXCELLENT" if relative_error < 0.01 else "GOOD" if relative_error < 0.05 else "CLOSE"